@@ -0,0 +1,16 @@
+"""
+Outbound Notification Adapters Package
+"""
+
+from .base import Notification, NotificationSender
+from .delivery import NotificationDelivery
+from .smtp import SmtpSender
+from .webhook import WebhookSender
+
+__all__ = [
+    'Notification',
+    'NotificationSender',
+    'NotificationDelivery',
+    'SmtpSender',
+    'WebhookSender'
+]
@@ -0,0 +1,70 @@
+"""
+Outbound Notification Abstract Base Classes Module
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Sequence
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True, slots=True)
+class Notification:
+    """
+    A single outbound notification.
+
+    Attributes:
+        destination: Target URL; the scheme selects the sender
+                     (``http``/``https`` for webhooks, ``smtp`` for e-mail)
+        subject: Short summary of the notification
+        body: Full notification text
+    """
+
+    destination: str
+    subject: str
+    body: str
+
+    @property
+    def scheme(self) -> str:
+        """
+        Return the destination URL scheme.
+        """
+        return urlsplit(self.destination).scheme
+
+    @property
+    def host(self) -> str:
+        """
+        Return the destination host and port, used for per-host limits.
+        """
+        return urlsplit(self.destination).netloc
+
+
+class NotificationSender(ABC):
+    """
+    Abstract base class for protocol-specific notification senders.
+
+    Senders own their connection pools and are shared across all
+    destinations of their protocol.
+    """
+
+    # Largest number of notifications delivered in one batch
+    max_batch_size: int = 1
+
+    @abstractmethod
+    async def send_batch(self, destination: str, notifications: Sequence[Notification]) -> None:
+        """
+        Deliver notifications that share the same destination.
+
+        Args:
+            destination: Target URL shared by all notifications
+            notifications: Notifications to deliver, at most max_batch_size
+
+        Raises:
+            Exception: If delivery fails; the whole batch is considered failed
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """
+        Release pooled connections.
+        """
@@ -0,0 +1,243 @@
+"""
+Notification Delivery Service Module
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Iterable, Optional
+from adapters.base import Notification, NotificationSender
+from common.logger_manager import LoggerManager
+
+
+class NotificationDelivery:
+    """
+    Asynchronous, batched delivery of outbound notifications.
+
+    Command handlers run on Pub/Sub worker threads and call ``submit``,
+    which hands the notification to the application event loop and returns
+    immediately. On the loop, notifications are buffered per destination and
+    flushed when a batch is full or after ``linger`` seconds. Each host has
+    its own concurrency limit, and the protocol senders reuse pooled
+    keep-alive connections.
+
+    The Pub/Sub message is acknowledged before its notifications are sent,
+    so a failed batch is retried up to ``max_attempts`` times with
+    exponential backoff. A batch that still fails is logged, counted in
+    ``failed`` and dropped: delivery is at-most-once past the retries, and
+    a retried batch may reach the destination twice.
+    """
+
+    def __init__(
+        self,
+        logger_manager: LoggerManager,
+        senders: dict[str, NotificationSender],
+        limit_per_host: int = 4,
+        linger: float = 0.05,
+        targets: Iterable[str] = (),
+        max_attempts: int = 3,
+        retry_backoff: float = 0.5,
+        close_timeout: float = 10.0,
+    ):
+        """
+        Initialize the delivery service.
+
+        Args:
+            logger_manager: Logger manager for structured logging
+            senders: Mapping of URL scheme to the sender for that protocol
+            limit_per_host: Maximum concurrent deliveries per destination host
+            linger: Seconds to wait for more notifications before flushing a
+                    partial batch
+            targets: Configured destinations, checked against the senders
+                     on start
+            max_attempts: Sends per batch before it is dropped
+            retry_backoff: Seconds before the first retry, doubled per retry
+            close_timeout: Seconds ``close`` waits for in-flight deliveries
+        """
+        self._senders = senders
+        self.limit_per_host = limit_per_host
+        self.linger = linger
+        self.targets = list(targets)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_backoff = retry_backoff
+        self.close_timeout = close_timeout
+        self.logger = logger_manager.get_logger(__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._buffers: dict[str, list[Notification]] = defaultdict(list)
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.delivered = 0
+        self.failed = 0
+        self.retried = 0
+
+    def start(self) -> None:
+        """
+        Bind the service to the running event loop.
+
+        Must be called from the application event loop before any
+        notification is submitted. Targets without a sender fail here, at
+        startup, rather than on the first incident.
+
+        Raises:
+            ValueError: If a configured target has no sender for its scheme
+        """
+        unsupported = [
+            target
+            for target in self.targets
+            if Notification(target, "", "").scheme not in self._senders
+        ]
+        if unsupported:
+            raise ValueError(
+                f"No sender for notification targets: {', '.join(unsupported)}"
+            )
+        self._loop = asyncio.get_running_loop()
+
+    def submit(self, notification: Notification) -> None:
+        """
+        Queue a notification for delivery. Safe to call from any thread.
+
+        Args:
+            notification: The notification to deliver
+
+        Raises:
+            RuntimeError: If the service has not been started
+            ValueError: If no sender handles the destination scheme
+        """
+        if self._loop is None:
+            raise RuntimeError("Notification delivery has not been started")
+        if notification.scheme not in self._senders:
+            raise ValueError(f"No sender for destination {notification.destination}")
+        self._loop.call_soon_threadsafe(self._enqueue, notification)
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flush buffered notifications, wait for in-flight deliveries and close
+        the senders' connection pools.
+
+        Deliveries still running after the timeout, including their pending
+        retries, are cancelled and counted as failed.
+
+        Args:
+            timeout: Seconds to wait for in-flight deliveries, defaults to
+                     ``close_timeout``
+        """
+        if timeout is None:
+            timeout = self.close_timeout
+        for destination in list(self._buffers):
+            self._flush(destination)
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        for sender in set(self._senders.values()):
+            await sender.close()
+        self.logger.info(
+            "Notification delivery closed",
+            delivered=self.delivered,
+            failed=self.failed,
+            retried=self.retried,
+        )
+
+    def _enqueue(self, notification: Notification) -> None:
+        """
+        Buffer a notification and schedule or trigger its batch flush.
+
+        Args:
+            notification: The notification to buffer
+        """
+        destination = notification.destination
+        buffer = self._buffers[destination]
+        buffer.append(notification)
+        if len(buffer) >= self._senders[notification.scheme].max_batch_size:
+            self._flush(destination)
+        elif destination not in self._flush_handles:
+            self._flush_handles[destination] = self._loop.call_later(
+                self.linger, self._flush, destination
+            )
+
+    def _flush(self, destination: str) -> None:
+        """
+        Start delivering the buffered batch for a destination.
+
+        Args:
+            destination: Destination whose buffer should be sent
+        """
+        handle = self._flush_handles.pop(destination, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._buffers.pop(destination, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._deliver(destination, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, destination: str, batch: list[Notification]) -> None:
+        """
+        Send one batch under the destination host's concurrency limit,
+        counting it as failed if the delivery is cancelled.
+
+        Args:
+            destination: Target URL shared by the batch
+            batch: Notifications to deliver
+        """
+        first = batch[0]
+        limit = self._host_limits.get(first.host)
+        if limit is None:
+            limit = self._host_limits[first.host] = asyncio.Semaphore(self.limit_per_host)
+        try:
+            await self._send_with_retries(destination, batch, limit)
+        except asyncio.CancelledError:
+            self.failed += len(batch)
+            self.logger.error(
+                "Notification delivery cancelled",
+                destination=destination,
+                count=len(batch),
+            )
+            raise
+
+    async def _send_with_retries(
+        self, destination: str, batch: list[Notification], limit: asyncio.Semaphore
+    ) -> None:
+        """
+        Send a batch, retrying failed sends with exponential backoff.
+
+        Args:
+            destination: Target URL shared by the batch
+            batch: Notifications to deliver
+            limit: Concurrency limit of the destination host
+        """
+        first = batch[0]
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                async with limit:
+                    await self._senders[first.scheme].send_batch(destination, batch)
+            except Exception as e:
+                if attempt < self.max_attempts:
+                    self.retried += len(batch)
+                    self.logger.warning(
+                        "Notification delivery failed, retrying",
+                        destination=destination,
+                        count=len(batch),
+                        attempt=attempt,
+                        error=str(e),
+                    )
+                    # Back off outside the host limit so other batches proceed
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+                    continue
+                self.failed += len(batch)
+                self.logger.error(
+                    "Notification delivery failed",
+                    destination=destination,
+                    count=len(batch),
+                    attempts=attempt,
+                    error=str(e),
+                )
+                return
+            self.delivered += len(batch)
+            self.logger.debug(
+                "Notifications delivered", destination=destination, count=len(batch)
+            )
+            return
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Local Stub Notification Servers Module
+
+In-process webhook and SMTP servers that record what they receive. They are
+used by the adapter tests and can be run locally as delivery targets:
+
+    python -m adapters.stub_server --http-port 8025 --smtp-port 8026
+"""
+
+import argparse
+import asyncio
+from aiohttp import web
+
+
+class StubWebhookServer:
+    """
+    Minimal HTTP server that records JSON webhook requests.
+
+    Attributes:
+        requests: Decoded JSON bodies in the order they were received
+        connections: Number of distinct client connections that sent requests
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, status: int = 200):
+        """
+        Initialize the stub webhook server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+            status: HTTP status returned for every request
+        """
+        self.host = host
+        self.port = port
+        self.status = status
+        self.requests = []
+        self._peers = set()
+        self._runner = None
+
+    @property
+    def url(self) -> str:
+        """
+        Return the base URL of the running server.
+        """
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """
+        Start serving on the event loop.
+        """
+        app = web.Application()
+        app.router.add_post("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            self.port = self._runner.addresses[0][1]
+
+    @property
+    def connections(self) -> int:
+        """
+        Return the number of distinct client connections seen.
+        """
+        return len(self._peers)
+
+    async def stop(self) -> None:
+        """
+        Stop the server.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self._peers.add(request.transport.get_extra_info("peername"))
+        self.requests.append(await request.json())
+        return web.Response(status=self.status)
+
+
+class StubSmtpServer:
+    """
+    Minimal SMTP server that accepts and records every message.
+
+    Attributes:
+        messages: (sender, recipients, data) tuples in the order received
+        connections: Number of SMTP sessions accepted
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the stub SMTP server.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+        """
+        self.host = host
+        self.port = port
+        self.messages = []
+        self.connections = 0
+        self._server = None
+
+    async def start(self) -> None:
+        """
+        Start serving on the event loop.
+        """
+        self._server = await asyncio.start_server(self._session, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stop the server.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+
+        async def reply(line: str):
+            writer.write(f"{line}\r\n".encode("ascii"))
+            await writer.drain()
+
+        await reply("220 stub ESMTP ready")
+        sender, recipients = None, []
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("utf-8").strip()
+                verb = command[:4].upper()
+                if verb == "EHLO":
+                    await reply("250-stub")
+                    await reply("250 8BITMIME")
+                elif verb == "HELO":
+                    await reply("250 stub")
+                elif verb == "MAIL":
+                    sender, recipients = _address(command), []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    recipients.append(_address(command))
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    data = []
+                    while True:
+                        chunk = await reader.readline()
+                        if chunk in (b".\r\n", b".\n", b""):
+                            break
+                        data.append(chunk)
+                    self.messages.append((sender, recipients, b"".join(data)))
+                    await reply("250 OK queued")
+                elif verb in ("RSET", "NOOP"):
+                    await reply("250 OK")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+
+def _address(command: str) -> str:
+    """
+    Extract the address from a MAIL FROM or RCPT TO command, dropping any
+    ESMTP parameters after it.
+    """
+    argument = command.split(":", 1)[1].strip()
+    if argument.startswith("<"):
+        return argument[1:argument.index(">")]
+    return argument.split(" ", 1)[0]
+
+
+async def _serve(http_port: int, smtp_port: int) -> None:
+    webhook = StubWebhookServer(port=http_port)
+    smtp = StubSmtpServer(port=smtp_port)
+    await webhook.start()
+    await smtp.start()
+    print(f"Webhook stub listening on {webhook.url}")
+    print(f"SMTP stub listening on smtp://{smtp.host}:{smtp.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await webhook.stop()
+        await smtp.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stub notification servers")
+    parser.add_argument("--http-port", type=int, default=8025)
+    parser.add_argument("--smtp-port", type=int, default=8026)
+    args = parser.parse_args()
+    try:
+        asyncio.run(_serve(args.http_port, args.smtp_port))
+    except KeyboardInterrupt:
+        pass
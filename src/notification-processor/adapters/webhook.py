@@ -0,0 +1,90 @@
+"""
+Webhook (HTTP) Notification Sender Module
+"""
+
+from typing import Sequence
+import aiohttp
+from adapters.base import Notification, NotificationSender
+
+
+class WebhookSender(NotificationSender):
+    """
+    Sender that POSTs notifications to HTTP(S) webhooks.
+
+    A batch is delivered as a single request whose JSON body is
+    ``{"notifications": [{"subject": ..., "body": ...}, ...]}``. Connections
+    are kept alive in a shared aiohttp connection pool that caps the number
+    of connections per host.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 20,
+        limit_per_host: int = 4,
+        timeout: float = 10.0,
+        keepalive_timeout: float = 30.0,
+    ):
+        """
+        Initialize the webhook sender.
+
+        Args:
+            max_batch_size: Maximum notifications per request
+            limit_per_host: Maximum pooled connections per host
+            timeout: Total timeout for a single request in seconds
+            keepalive_timeout: Seconds an idle connection stays in the pool
+        """
+        self.max_batch_size = max_batch_size
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self._session = None
+
+    async def send_batch(self, destination: str, notifications: Sequence[Notification]) -> None:
+        """
+        POST a batch of notifications to a webhook URL.
+
+        Args:
+            destination: Webhook URL
+            notifications: Notifications to deliver
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns an error status
+        """
+        payload = {
+            "notifications": [
+                {"subject": n.subject, "body": n.body} for n in notifications
+            ]
+        }
+        session = self._get_session()
+        async with session.post(destination, json=payload) as response:
+            response.raise_for_status()
+            # Read the body so the connection can go back to the pool
+            await response.read()
+
+    async def close(self) -> None:
+        """
+        Close the HTTP session and its connection pool.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+
+        The session is created lazily so it binds to the running event loop.
+
+        Returns:
+            aiohttp.ClientSession: The pooled session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
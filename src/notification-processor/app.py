@@ -74,13 +74,48 @@ async def main():
             )
         except NotImplementedError:
             pass
+
+    # SIGUSR1 opens a sampled profiling window on a live pod
+    profiler = container.message_profiler()
+    profiler.start()
+    try:
+        loop.add_signal_handler(signal.SIGUSR1, profiler.start_window)
+    except (NotImplementedError, AttributeError):
+        pass
+    notification_delivery = container.notification_delivery()
+    notification_delivery.start()
+
+    # Rebuild the incident index from the last snapshot, if any
+    incident_store = container.incident_store()
+    snapshot_path = config.get("incident_snapshot_path")
+    if snapshot_path and os.path.exists(snapshot_path):
+        try:
+            loaded = incident_store.load(snapshot_path)
+            logger.info("Incident snapshot loaded", path=snapshot_path, incidents=loaded)
+        except Exception as e:
+            logger.error(f"Could not load incident snapshot {snapshot_path}: {e}")
+
     subscriber_task = asyncio.create_task(subscriber.run_subscriber())
     await shutdown_event.wait()
-    subscriber_task.cancel()
+
     try:
+        # Drain in-flight work instead of cancelling it; the timeout must stay
+        # below the pod's terminationGracePeriodSeconds.
+        await subscriber.drain(
+            config.get("drain_timeout", config_manager.drain_timeout)
+        )
         await subscriber_task
     except asyncio.CancelledError:
         logger.error("Subscriber task cancelled.")
+    finally:
+        # Save the snapshot first so a slow delivery flush cannot lose it
+        if snapshot_path:
+            saved = incident_store.save(snapshot_path)
+            logger.info("Incident snapshot saved", path=snapshot_path, incidents=saved)
+        await notification_delivery.close()
+        profiler.stop()
+        container.tracer().close()
+        logging_manager.flush()
 
 
 if __name__ == "__main__":
@@ -4,12 +4,23 @@ Application Commands & CommandHandler Package
 
 from .create_incident import (CreateIncidentCommand,
     CreateIncidentCommandHandler)
-from .factory import CommandFactory
+from .factory import BatchItem, CommandFactory
+from .resolve_incident import (ResolveIncidentCommand,
+    ResolveIncidentCommandHandler)
+from .update_incident import (UpdateIncidentCommand,
+    UpdateIncidentCommandHandler)
 from .base import Command
+from .compact import CompactCommand
 
 __all__ = [
     'CreateIncidentCommand',
     'CreateIncidentCommandHandler',
+    'UpdateIncidentCommand',
+    'UpdateIncidentCommandHandler',
+    'ResolveIncidentCommand',
+    'ResolveIncidentCommandHandler',
+    'BatchItem',
     'CommandFactory',
-    'Command'
+    'Command',
+    'CompactCommand'
 ]
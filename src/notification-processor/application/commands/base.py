@@ -9,7 +9,7 @@ class Command(ABC):
     """
     Abstract base class that serves as a marker for all command objects.
     """
-    pass
+    __slots__ = ()
 
 # Define a generic type variable that must be a subclass of Command.
 TCommand = TypeVar('TCommand', bound=Command)
@@ -0,0 +1,205 @@
+"""
+Compact Command Representation Module
+"""
+
+import json
+import types
+import typing
+from abc import ABCMeta
+from typing import Any, Callable
+from application.commands.base import Command
+
+_MISSING = object()
+
+
+class CompactCommandMeta(ABCMeta):
+    """
+    Metaclass that turns annotated fields into ``__slots__`` and compiles a
+    dedicated decoder for every command class.
+
+    Class-level values next to an annotation become field defaults; they are
+    removed from the class namespace so they do not clash with the slots.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        annotations = namespace.get("__annotations__")
+        if annotations is None and "__annotate__" in namespace:
+            annotations = namespace["__annotate__"](1)
+        annotations = {
+            field: hint
+            for field, hint in (annotations or {}).items()
+            if typing.get_origin(hint) is not typing.ClassVar
+        }
+        defaults = {
+            field: namespace.pop(field)
+            for field in annotations
+            if field in namespace
+        }
+        namespace["__slots__"] = tuple(annotations)
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+
+        fields = {}
+        field_defaults = {}
+        for base in reversed(cls.__mro__[1:]):
+            fields.update(getattr(base, "_fields", {}))
+            field_defaults.update(getattr(base, "_defaults", {}))
+        fields.update(annotations)
+        field_defaults.update(defaults)
+        cls._fields = fields
+        cls._defaults = field_defaults
+        if fields:
+            cls._decode = staticmethod(_compile_decoder(cls))
+        return cls
+
+
+class CompactCommand(Command, metaclass=CompactCommandMeta):
+    """
+    Base class for slotted commands decoded on the message hot path.
+
+    Subclasses declare their fields as annotations, like a pydantic model.
+    Instances carry no ``__dict__`` and are built by a decoder compiled once
+    per class, which checks field types and then calls ``validate`` for any
+    rule that goes beyond a type check.
+    """
+
+    def __init__(self, **fields):
+        """
+        Initialize the command from keyword arguments.
+
+        Raises:
+            ValueError: If a field is missing, has the wrong type or fails validation
+        """
+        type(self)._decode(fields, self)
+
+    @classmethod
+    def decode(cls, payload: dict) -> "CompactCommand":
+        """
+        Build a command from a decoded mapping.
+
+        Args:
+            payload: Mapping of field names to values; unknown keys are ignored
+
+        Returns:
+            CompactCommand: A validated command instance
+
+        Raises:
+            ValueError: If a field is missing, has the wrong type or fails validation
+        """
+        return cls._decode(payload)
+
+    @classmethod
+    def decode_json(cls, data: bytes) -> "CompactCommand":
+        """
+        Build a command from a JSON object encoded as bytes.
+
+        Args:
+            data: UTF-8 JSON object
+
+        Returns:
+            CompactCommand: A validated command instance
+
+        Raises:
+            ValueError: If the JSON is invalid or the command fails validation
+        """
+        payload = json.loads(data)
+        if not isinstance(payload, dict):
+            raise ValueError(f"{cls.__name__} payload must be a JSON object")
+        return cls._decode(payload)
+
+    def validate(self) -> None:
+        """
+        Hook for rules beyond field types; raise ValueError to reject.
+        """
+
+    def as_dict(self) -> dict:
+        """
+        Return the command fields as a dictionary.
+
+        Returns:
+            dict: Field names mapped to their values
+        """
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self._fields)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+def _type_check(hint) -> tuple:
+    """
+    Translate a field annotation into the types accepted by isinstance.
+
+    Args:
+        hint: The field annotation
+
+    Returns:
+        tuple: Accepted types, or an empty tuple when any value is accepted
+    """
+    if hint is Any:
+        return ()
+    origin = typing.get_origin(hint)
+    if origin in (typing.Union, types.UnionType):
+        accepted = []
+        for arg in typing.get_args(hint):
+            accepted.extend(_type_check(arg) or (object,))
+        return tuple(accepted)
+    if origin is not None:
+        return (origin,)
+    if hint is float:
+        return (float, int)
+    return (hint,)
+
+
+def _compile_decoder(cls) -> Callable:
+    """
+    Generate the decoder for a compact command class.
+
+    The decoder is plain Python with one straight-line block per field, so
+    decoding costs a dictionary lookup, an isinstance check and a slot store
+    per field.
+
+    Args:
+        cls: The compact command class
+
+    Returns:
+        Callable: ``decode(payload, self=None)`` returning a command instance
+    """
+    env = {"_cls": cls, "_new": object.__new__, "_MISSING": _MISSING}
+    lines = [
+        "def decode(payload, self=None):",
+        "    if self is None:",
+        "        self = _new(_cls)",
+    ]
+    for index, (field, hint) in enumerate(cls._fields.items()):
+        var = f"v{index}"
+        if field in cls._defaults:
+            env[f"_default_{index}"] = cls._defaults[field]
+            lines.append(f"    {var} = payload.get({field!r}, _default_{index})")
+        else:
+            lines += [
+                f"    {var} = payload.get({field!r}, _MISSING)",
+                f"    if {var} is _MISSING:",
+                f"        raise ValueError('{cls.__name__}.{field} is required')",
+            ]
+        accepted = _type_check(hint)
+        if accepted and object not in accepted:
+            env[f"_types_{index}"] = accepted
+            names = " | ".join(getattr(t, "__name__", str(t)) for t in accepted)
+            lines += [
+                f"    if not isinstance({var}, _types_{index}):",
+                f"        raise ValueError('{cls.__name__}.{field} must be {names}')",
+            ]
+        lines.append(f"    self.{field} = {var}")
+    lines += [
+        "    self.validate()",
+        "    return self",
+    ]
+    exec("\n".join(lines), env)
+    return env["decode"]
@@ -2,21 +2,48 @@
 Create Incident Command and Handler Module
 """
 
-from pydantic import BaseModel
-from .base import Command, CommandHandler
+import time
+import uuid
+from typing import Optional
+from .base import CommandHandler
+from .compact import CompactCommand
+from adapters.base import Notification
+from adapters.delivery import NotificationDelivery
 from config.config_manager import ConfigManager
 from common.logger_manager import LoggerManager
+from domain.incident import Incident
+from domain.incident_store import IncidentStore
 
 
-class CreateIncidentCommand(BaseModel, Command):
+class CreateIncidentCommand(CompactCommand):
     """
     Command object that holds the data required to create a new incident.
 
     Attributes:
         description: Human-readable description of the incident
+        severity: Incident severity such as ``SEV1``, recorded on the
+                  incident; laning uses the message's ``severity``
+                  attribute, not this field
+        incident_id: Identifier to use, generated when omitted
+        fingerprint: Deduplication key from the alert source
+        service: Service the incident belongs to
     """
 
     description: str
+    severity: Optional[str] = None
+    incident_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    service: Optional[str] = None
+
+    def validate(self) -> None:
+        """
+        Reject incidents without a description.
+
+        Raises:
+            ValueError: If the incident description is empty
+        """
+        if not self.description:
+            raise ValueError("Incident description cannot be empty.")
 
 
 class CreateIncidentCommandHandler(CommandHandler[CreateIncidentCommand]):
@@ -24,29 +51,74 @@ class CreateIncidentCommandHandler(CommandHandler[CreateIncidentCommand]):
     Handler responsible for executing the CreateIncidentCommand.
     """
 
-    def __init__(self, config_manager: ConfigManager, logger_manager: LoggerManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logger_manager: LoggerManager,
+        notification_delivery: NotificationDelivery,
+        incident_store: IncidentStore,
+    ):
         """
         Initialize the create incident command handler.
 
         Args:
             config_manager: Configuration manager for accessing settings
             logger_manager: Logger manager for structured logging
+            notification_delivery: Outbound delivery service for notifications
+            incident_store: In-memory store of tracked incidents
         """
         self.config_manager = config_manager
+        self.notification_delivery = notification_delivery
+        self.incident_store = incident_store
         self.logger = logger_manager.get_logger(__name__)
 
     def handle(self, command: CreateIncidentCommand) -> None:
         """
         Orchestrate the creation of a new incident.
 
+        Duplicates, either a redelivered incident id or a fingerprint that
+        already has an unresolved incident, only refresh the existing
+        incident and send no notification.
+
         Args:
             command: The create incident command to process
 
         Raises:
             ValueError: If the incident description is empty or invalid
+            IncidentStoreFullError: If no resolved incident can be evicted
         """
         if not command.description:
             raise ValueError("Incident description cannot be empty.")
+
+        now = time.time()
+        incident, created = self.incident_store.add_or_get(
+            Incident(
+                incident_id=command.incident_id or uuid.uuid4().hex,
+                description=command.description,
+                fingerprint=command.fingerprint,
+                service=command.service,
+                severity=command.severity,
+                created_at=now,
+                updated_at=now,
+            ),
+            now=now,
+        )
+        if not created:
+            self.logger.info(
+                "Duplicate incident ignored",
+                incident_id=incident.incident_id,
+                fingerprint=command.fingerprint,
+            )
+            return
+
         self.logger.info(
             f"Successfully created incident for customer: {command.description}"
         )
+        for target in self.config_manager.notification_targets:
+            self.notification_delivery.submit(
+                Notification(
+                    destination=target,
+                    subject=f"Incident {incident.incident_id} created",
+                    body=command.description,
+                )
+            )
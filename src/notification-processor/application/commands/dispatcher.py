@@ -5,6 +5,7 @@ Command Dispatcher Module
 from typing import Type, Tuple
 from dependency_injector.providers import Provider
 from common.logger_manager import LoggerManager
+from common.tracing import stage
 from application.commands.base import Command, CommandHandler
 
 class CommandDispatcher:
@@ -51,5 +52,6 @@ class CommandDispatcher:
             # 3. Create an instance of the handler from the provider.
             handler = provider()
 
-            # 4. Execute the handler's logic.
-            handler.handle(command)
+            # 4. Execute the handler's logic, timed as its own trace stage.
+            with stage(f"handle.{type(handler).__name__}"):
+                handler.handle(command)
@@ -2,30 +2,88 @@
 Command Factory Module
 """
 
-from typing import Type
+import json
+import zlib
+from typing import Iterator, NamedTuple, Optional, Type
 from application.commands.base import Command
+from application.commands.compact import CompactCommand
 from application.commands.create_incident import CreateIncidentCommand
+from application.commands.resolve_incident import ResolveIncidentCommand
+from application.commands.update_incident import UpdateIncidentCommand
+from common.tracing import stage
+
+CONTENT_ENCODING_ATTRIBUTE = "content-encoding"
+CONTENT_TYPE_ATTRIBUTE = "content-type"
+SEVERITY_ATTRIBUTE = "severity"
+COMMAND_TYPE_ATTRIBUTE = "command-type"
+# Publish wall-clock time in nanoseconds, stamped by the load generator
+PUBLISH_TIME_ATTRIBUTE = "publish-time-ns"
+# Trace id propagated by the publisher; generated on receipt when absent
+TRACE_ID_ATTRIBUTE = "trace-id"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+JSON_CONTENT_TYPE = "application/json"
+DEFAULT_COMMAND_TYPE = "CreateIncident"
+
+# zlib window bits per supported content-encoding (gzip adds 16 for its header)
+_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "zlib": zlib.MAX_WBITS,
+}
+_CHUNK_SIZE = 64 * 1024
+
+
+class BatchItem(NamedTuple):
+    """
+    One entry of a batch envelope.
+
+    Attributes:
+        index: Zero-based position of the item in the envelope
+        command: The decoded command, or None if decoding failed
+        error: The decoding error, or None if the item is valid
+    """
+
+    index: int
+    command: Optional[Command]
+    error: Optional[Exception]
 
 
 class CommandFactory:
     """
     Factory for creating command objects from raw data payloads.
+
+    Messages may be compressed (``content-encoding`` attribute set to
+    ``gzip`` or ``zlib``) and may carry a batch envelope (``content-type``
+    attribute set to ``application/x-ndjson`` or ``application/json`` with a
+    top-level array). Each envelope item is either a JSON string holding the
+    description, or an object with an optional ``type`` field naming the
+    command and the command fields alongside it.
     """
 
-    def __init__(self):
+    def __init__(self, max_decompressed_bytes: int = 16 * 1024 * 1024):
         """
         Initialize the command factory with registered command types.
+
+        Args:
+            max_decompressed_bytes: Upper bound on the decompressed size of a
+                                    single message, guarding against
+                                    compression bombs
         """
-        self._commands: dict[str, Type[Command]] = {
+        self._commands: dict[str, Type[CompactCommand]] = {
             "CreateIncident": CreateIncidentCommand,
+            "UpdateIncident": UpdateIncidentCommand,
+            "ResolveIncident": ResolveIncidentCommand,
             # Add other command names and their classes here
-            # "ResolveIncident": ResolveIncidentCommand,
         }
+        self._max_decompressed_bytes = max_decompressed_bytes
 
     def create(self, message) -> Command:
         """
         Instantiate and return a command object based on the message content.
 
+        Without a ``command-type`` attribute the body is the plain-text
+        description of a new incident. With it, the body is a JSON object
+        holding the fields of the named command.
+
         Args:
             message: Pub/Sub message containing command data
 
@@ -36,11 +94,221 @@ class CommandFactory:
             ValueError: If the command type is not registered or message is invalid
         """
 
-        payload = {"description": message.data.decode("utf-8")}
+        with stage("decode"):
+            command_type = _attributes(message).get(COMMAND_TYPE_ATTRIBUTE)
+            if command_type:
+                command_class = self._commands.get(command_type)
+                if not command_class:
+                    raise ValueError(f"Unknown command type: {command_type}")
+                return command_class.decode_json(self._read(message))
+
+            command_class = self._commands.get("CreateIncident")
+            if not command_class:
+                raise ValueError("Unknown command type")
+
+            # The compiled decoder validates and fills the slots in one pass
+            return command_class.decode({
+                "description": self._read(message).decode("utf-8"),
+                "severity": _attributes(message).get(SEVERITY_ATTRIBUTE),
+            })
+
+    def is_batch(self, message) -> bool:
+        """
+        Check whether a message carries a batch envelope.
+
+        Args:
+            message: Pub/Sub message to inspect
 
-        command_class = self._commands.get("CreateIncident")
+        Returns:
+            bool: True if the message content type is a batch envelope
+        """
+        content_type = _attributes(message).get(CONTENT_TYPE_ATTRIBUTE)
+        return content_type in (NDJSON_CONTENT_TYPE, JSON_CONTENT_TYPE)
+
+    def create_batch(self, message) -> Iterator[BatchItem]:
+        """
+        Lazily expand a batch envelope into commands.
+
+        Items are decoded one at a time as the caller iterates. An item that
+        cannot be turned into a command is yielded with its error instead of
+        aborting the batch, so the caller can skip it and still acknowledge
+        the message. Errors in the envelope itself (unknown encoding, corrupt
+        or truncated stream, size limit, malformed array) are raised before
+        the first item is yielded, so a nacked envelope never has items that
+        were already dispatched and would be dispatched again on redelivery.
+
+        Args:
+            message: Pub/Sub message containing a batch envelope
+
+        Yields:
+            BatchItem: One entry per envelope item, in order
+
+        Raises:
+            ValueError: If the envelope cannot be read
+        """
+        content_type = _attributes(message).get(CONTENT_TYPE_ATTRIBUTE)
+        if content_type == NDJSON_CONTENT_TYPE:
+            items = self._iter_ndjson(message)
+        elif content_type == JSON_CONTENT_TYPE:
+            items = self._iter_json_array(message)
+        else:
+            raise ValueError(f"Unsupported batch content type: {content_type}")
+
+        for index, raw in enumerate(items):
+            try:
+                with stage("decode"):
+                    item = json.loads(raw) if isinstance(raw, bytes) else raw
+                    command = self._build(item)
+            except ValueError as e:
+                yield BatchItem(index, None, e)
+                continue
+            yield BatchItem(index, command, None)
+
+    def _build(self, item) -> Command:
+        """
+        Build a command from a single decoded envelope item.
+
+        Args:
+            item: A description string or an object with command fields
+
+        Returns:
+            Command: An instance of a concrete command class
+
+        Raises:
+            ValueError: If the item is malformed or names an unknown command
+        """
+        if isinstance(item, str):
+            item = {"description": item}
+        if not isinstance(item, dict):
+            raise ValueError(f"Batch item must be a string or object, got {type(item).__name__}")
+        command_type = item.get("type", DEFAULT_COMMAND_TYPE)
+        command_class = self._commands.get(command_type)
         if not command_class:
-            raise ValueError("Unknown command type")
+            raise ValueError(f"Unknown command type: {command_type}")
+        # Unknown keys, including "type", are ignored by the decoder
+        return command_class.decode(item)
+
+    def _iter_ndjson(self, message) -> Iterator[bytes]:
+        """
+        Split a (possibly compressed) NDJSON body into lines.
+
+        The whole body is decompressed, within the size limit, before the
+        first line is yielded, so a truncated or oversized envelope fails
+        before any of its items has been dispatched. Lines are then sliced
+        from the buffer one at a time.
+
+        Args:
+            message: Pub/Sub message containing NDJSON data
+
+        Yields:
+            bytes: Each non-blank line of the body, still JSON encoded
+        """
+        body = self._read(message)
+        start, size = 0, len(body)
+        while start < size:
+            end = body.find(b"\n", start)
+            if end == -1:
+                end = size
+            line = body[start:end]
+            start = end + 1
+            if line.strip():
+                yield line
+
+    def _iter_json_array(self, message) -> Iterator[object]:
+        """
+        Parse a (possibly compressed) JSON array body.
+
+        Args:
+            message: Pub/Sub message containing a JSON array
+
+        Yields:
+            object: Each decoded array element
+
+        Raises:
+            ValueError: If the body is not a JSON array
+        """
+        items = json.loads(self._read(message))
+        if not isinstance(items, list):
+            raise ValueError("JSON batch envelope must be an array")
+        yield from items
+
+    def _read(self, message) -> bytes:
+        """
+        Return the full, decompressed message body.
+
+        Args:
+            message: Pub/Sub message to read
+
+        Returns:
+            bytes: The decoded body
+        """
+        return b"".join(self._iter_chunks(message))
+
+    def _iter_chunks(self, message) -> Iterator[bytes]:
+        """
+        Stream the decompressed message body in bounded chunks.
+
+        Args:
+            message: Pub/Sub message to read
 
-        # Pydantic models can be instantiated directly from a dictionary
-        return command_class(**payload)
+        Yields:
+            bytes: Successive chunks of the decoded body
+
+        Raises:
+            ValueError: If the encoding is unsupported, the stream is corrupt
+                        or has trailing data, or the body exceeds the
+                        decompressed size limit
+        """
+        encoding = _attributes(message).get(CONTENT_ENCODING_ATTRIBUTE)
+        if not encoding or encoding == "identity":
+            yield message.data
+            return
+
+        wbits = _WBITS.get(encoding)
+        if wbits is None:
+            raise ValueError(f"Unsupported content encoding: {encoding}")
+
+        limit = self._max_decompressed_bytes
+        data = message.data
+        total = 0
+        while True:
+            decompressor = zlib.decompressobj(wbits)
+            try:
+                while data:
+                    chunk = decompressor.decompress(data, _CHUNK_SIZE)
+                    data = decompressor.unconsumed_tail
+                    total += len(chunk)
+                    if total > limit:
+                        raise ValueError(f"Decompressed message exceeds {limit} bytes")
+                    if chunk:
+                        yield chunk
+                tail = decompressor.flush()
+            except zlib.error as e:
+                raise ValueError(f"Corrupt {encoding} payload: {e}") from e
+            if not decompressor.eof:
+                raise ValueError(f"Truncated {encoding} payload")
+            total += len(tail)
+            if total > limit:
+                raise ValueError(f"Decompressed message exceeds {limit} bytes")
+            if tail:
+                yield tail
+            data = decompressor.unused_data
+            if not data:
+                return
+            # A gzip body may hold several members, e.g. concatenated files;
+            # a zlib stream has exactly one.
+            if encoding != "gzip":
+                raise ValueError(f"Trailing data after {encoding} payload")
+
+
+def _attributes(message) -> dict:
+    """
+    Return the message attributes, tolerating messages without any.
+
+    Args:
+        message: Pub/Sub message
+
+    Returns:
+        dict: The message attributes
+    """
+    return getattr(message, "attributes", None) or {}
@@ -0,0 +1,92 @@
+"""
+Resolve Incident Command and Handler Module
+"""
+
+from typing import Optional
+from .base import CommandHandler
+from .compact import CompactCommand
+from adapters.base import Notification
+from adapters.delivery import NotificationDelivery
+from config.config_manager import ConfigManager
+from common.logger_manager import LoggerManager
+from domain.incident_store import IncidentStore
+
+
+class ResolveIncidentCommand(CompactCommand):
+    """
+    Command object that identifies the incident to resolve.
+
+    Attributes:
+        incident_id: Identifier of the incident to resolve
+        fingerprint: Deduplication key, used when no id is given
+    """
+
+    incident_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+
+    def validate(self) -> None:
+        """
+        Require a way to find the incident.
+
+        Raises:
+            ValueError: If neither id nor fingerprint is set
+        """
+        if not self.incident_id and not self.fingerprint:
+            raise ValueError("Incident id or fingerprint is required.")
+
+
+class ResolveIncidentCommandHandler(CommandHandler[ResolveIncidentCommand]):
+    """
+    Handler responsible for executing the ResolveIncidentCommand.
+    """
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logger_manager: LoggerManager,
+        notification_delivery: NotificationDelivery,
+        incident_store: IncidentStore,
+    ):
+        """
+        Initialize the resolve incident command handler.
+
+        Args:
+            config_manager: Configuration manager for accessing settings
+            logger_manager: Logger manager for structured logging
+            notification_delivery: Outbound delivery service for notifications
+            incident_store: In-memory store of tracked incidents
+        """
+        self.config_manager = config_manager
+        self.notification_delivery = notification_delivery
+        self.incident_store = incident_store
+        self.logger = logger_manager.get_logger(__name__)
+
+    def handle(self, command: ResolveIncidentCommand) -> None:
+        """
+        Resolve the incident and notify the configured targets.
+
+        Unknown or already resolved incidents are logged and skipped.
+
+        Args:
+            command: The resolve incident command to process
+        """
+        # Concurrent resolves of one incident notify only once
+        incident, resolved = self.incident_store.resolve_active(
+            command.incident_id, command.fingerprint
+        )
+        if not resolved:
+            self.logger.warning(
+                "Resolve for unknown or resolved incident ignored",
+                incident_id=command.incident_id,
+                fingerprint=command.fingerprint,
+            )
+            return
+        self.logger.info("Incident resolved", incident_id=incident.incident_id)
+        for target in self.config_manager.notification_targets:
+            self.notification_delivery.submit(
+                Notification(
+                    destination=target,
+                    subject=f"Incident {incident.incident_id} resolved",
+                    body=incident.description,
+                )
+            )
@@ -0,0 +1,96 @@
+"""
+Update Incident Command and Handler Module
+"""
+
+from typing import Optional
+from .base import CommandHandler
+from .compact import CompactCommand
+from common.logger_manager import LoggerManager
+from domain.incident import IncidentStatus
+from domain.incident_store import IncidentStore
+
+
+class UpdateIncidentCommand(CompactCommand):
+    """
+    Command object that holds the changes to apply to an incident.
+
+    Attributes:
+        incident_id: Identifier of the incident to update
+        fingerprint: Deduplication key, used when no id is given
+        description: New description, unchanged if omitted
+        severity: New severity, unchanged if omitted
+        status: New status name such as ``ACKNOWLEDGED``, unchanged if omitted
+    """
+
+    incident_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    description: Optional[str] = None
+    severity: Optional[str] = None
+    status: Optional[str] = None
+
+    def validate(self) -> None:
+        """
+        Require a way to find the incident and a known status.
+
+        Raises:
+            ValueError: If neither id nor fingerprint is set, or the status is unknown
+        """
+        if not self.incident_id and not self.fingerprint:
+            raise ValueError("Incident id or fingerprint is required.")
+        if self.status is not None and self.status.upper() not in IncidentStatus.__members__:
+            raise ValueError(f"Unknown incident status: {self.status}")
+
+
+class UpdateIncidentCommandHandler(CommandHandler[UpdateIncidentCommand]):
+    """
+    Handler responsible for executing the UpdateIncidentCommand.
+    """
+
+    def __init__(self, logger_manager: LoggerManager, incident_store: IncidentStore):
+        """
+        Initialize the update incident command handler.
+
+        Args:
+            logger_manager: Logger manager for structured logging
+            incident_store: In-memory store of tracked incidents
+        """
+        self.incident_store = incident_store
+        self.logger = logger_manager.get_logger(__name__)
+
+    def handle(self, command: UpdateIncidentCommand) -> None:
+        """
+        Apply the changes to the incident.
+
+        Unknown incidents and rejected reopens are logged and skipped,
+        since redelivering the update would not change the outcome.
+
+        Args:
+            command: The update incident command to process
+        """
+        incident = self.incident_store.find(command.incident_id, command.fingerprint)
+        if incident is None:
+            self.logger.warning(
+                "Update for unknown incident ignored",
+                incident_id=command.incident_id,
+                fingerprint=command.fingerprint,
+            )
+            return
+        status = IncidentStatus[command.status.upper()] if command.status else None
+        try:
+            incident = self.incident_store.update(
+                incident.incident_id,
+                description=command.description,
+                severity=command.severity,
+                status=status,
+            )
+        except ValueError as e:
+            # A conflicting reopen fails the same way on every redelivery
+            self.logger.warning(
+                "Update rejected", incident_id=incident.incident_id, error=str(e)
+            )
+            return
+        self.logger.info(
+            "Incident updated",
+            incident_id=incident.incident_id,
+            status=incident.status.name,
+        )
@@ -0,0 +1,66 @@
+"""
+Latency Tracking Module
+"""
+
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """
+    Thread-safe recorder of recent latency samples with percentile summaries.
+
+    Only the most recent ``window`` samples are kept, so memory stays bounded
+    during long load tests while the summary tracks current behaviour.
+    """
+
+    def __init__(self, window: int = 10_000):
+        """
+        Initialize the latency tracker.
+
+        Args:
+            window: Number of most recent samples kept for percentiles
+        """
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, seconds: float) -> int:
+        """
+        Record one latency sample.
+
+        Args:
+            seconds: Measured latency in seconds
+
+        Returns:
+            int: Total number of samples recorded so far
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            return self.count
+
+    def summary(self) -> dict:
+        """
+        Summarize the recent samples.
+
+        Returns:
+            dict: Sample count and p50/p95/p99/max latency in milliseconds
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+        if not samples:
+            return {"count": count}
+
+        def percentile(p):
+            index = min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))
+            return round(samples[index] * 1000, 3)
+
+        return {
+            "count": count,
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "p99_ms": percentile(99),
+            "max_ms": round(samples[-1] * 1000, 3),
+        }
@@ -13,6 +13,8 @@ class LoggerManager:
     """
 
     _shared_processors = [
+        # Adds context bound per message, such as the trace id
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
@@ -61,3 +63,13 @@ class LoggerManager:
             structlog.BoundLogger: Configured logger instance
         """
         return structlog.get_logger(name)
+
+    def flush(self):
+        """
+        Flush every handler attached to the root logger.
+
+        Called during shutdown so buffered log records are written before
+        the process exits.
+        """
+        for handler in logging.getLogger().handlers:
+            handler.flush()
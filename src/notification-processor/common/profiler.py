@@ -0,0 +1,333 @@
+"""
+Sampled Message Profiler Module
+"""
+
+import io
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from config.config_manager import ConfigManager
+from common.logger_manager import LoggerManager
+
+
+class _ThreadProfile:
+    """
+    Deterministic profiler for the calling thread only.
+
+    cProfile hooks into sys.monitoring on Python 3.12+, which covers every
+    thread, so concurrent unsampled messages would be profiled as well.
+    ``sys.setprofile`` is per thread: only the sampled message pays for it
+    and only its calls are counted.
+    """
+
+    __slots__ = ("stats", "_stack", "_active")
+
+    def __init__(self):
+        # key -> [calls, own seconds, cumulative seconds]
+        self.stats: dict[tuple, list] = {}
+        self._stack: list[list] = []
+        self._active: dict[tuple, int] = defaultdict(int)
+
+    def __enter__(self):
+        sys.setprofile(self._event)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.setprofile(None)
+
+    def _event(self, frame, event, arg):
+        now = time.perf_counter()
+        if event == "call" or event == "c_call":
+            if event == "call":
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+            else:
+                key = ("~", 0, f"<built-in {getattr(arg, '__qualname__', arg)}>")
+            self._active[key] += 1
+            self._stack.append([key, now, 0.0])
+        elif self._stack:
+            # return, c_return or c_exception; returns of frames entered
+            # before profiling started find an empty stack and are ignored
+            key, started, children = self._stack.pop()
+            elapsed = now - started
+            stat = self.stats.get(key)
+            if stat is None:
+                stat = self.stats[key] = [0, 0.0, 0.0]
+            stat[0] += 1
+            stat[1] += elapsed - children
+            self._active[key] -= 1
+            # Recursive calls count towards cumulative time only once
+            if not self._active[key]:
+                stat[2] += elapsed
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+
+class MessageProfiler:
+    """
+    Sampling profiler for the message processing path.
+
+    Profiling is off by default. A profiling window is opened either by
+    ``start_window`` (wired to SIGUSR1) or continuously when a sampling rate
+    is configured. While a window is open a fraction of messages is run
+    under a per-thread profiler, and optionally tracemalloc; when the window
+    closes the aggregated statistics are written to a report file. Outside a window
+    ``should_sample`` is a single attribute check, so unsampled messages pay
+    no profiling cost.
+
+    tracemalloc has no per-thread mode: while a sampled message runs, every
+    worker thread's allocations are traced and land in the snapshot diff.
+    The allocation section of the report is therefore labelled as
+    process-wide, and ``profile_allocations`` turns it off so concurrent
+    unsampled messages pay nothing.
+    """
+
+    _tracemalloc_filters = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    )
+
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        logger_manager: LoggerManager,
+        top_n: int = 25,
+    ):
+        """
+        Initialize the message profiler.
+
+        Args:
+            config_manager: Configuration manager for accessing settings
+            logger_manager: Logger manager for structured logging
+            top_n: Number of functions and allocation sites in the report
+        """
+        self.sample_rate = config_manager.profile_sample_rate
+        self.signal_sample_rate = config_manager.profile_signal_sample_rate
+        self.window_seconds = config_manager.profile_window_seconds
+        self.report_dir = config_manager.profile_report_dir
+        self.trace_allocations = bool(config_manager.profile_allocations)
+        self.top_n = top_n
+        self.logger = logger_manager.get_logger(__name__)
+        self._lock = threading.Lock()
+        # At most one message is profiled at a time, which bounds the
+        # profiling overhead to a single worker.
+        self._profiling = threading.Lock()
+        self._active_rate = 0.0
+        self._timer = None
+        self._reset()
+
+    def start(self):
+        """
+        Start continuous profiling if a sampling rate is configured.
+        """
+        if self.sample_rate > 0:
+            self.start_window(self.sample_rate)
+
+    def start_window(self, sample_rate: float = None):
+        """
+        Open a profiling window.
+
+        Args:
+            sample_rate: Fraction of messages to profile, defaults to the
+                         signal sampling rate
+        """
+        rate = self.signal_sample_rate if sample_rate is None else sample_rate
+        with self._lock:
+            if self._active_rate > 0:
+                self.logger.info("Profiling window already open")
+                return
+            self._reset()
+            self._active_rate = rate
+            self._timer = threading.Timer(self.window_seconds, self._end_window)
+            self._timer.daemon = True
+            self._timer.start()
+        self.logger.info(
+            "Profiling window opened",
+            sample_rate=rate,
+            window_seconds=self.window_seconds,
+        )
+
+    def stop(self):
+        """
+        Close any open profiling window and write its report.
+        """
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+            self._end_window(restart=False)
+
+    def should_sample(self) -> bool:
+        """
+        Decide whether the current message should be profiled.
+
+        Returns:
+            bool: True if a window is open and the message was sampled
+        """
+        rate = self._active_rate
+        return rate > 0 and random.random() < rate
+
+    @contextmanager
+    def profile(self):
+        """
+        Profile the enclosed block and add the result to the open window.
+
+        If another message is already being profiled the block runs
+        unprofiled.
+        """
+        if not self._profiling.acquire(blocking=False):
+            yield
+            return
+        try:
+            profiler = _ThreadProfile()
+            started_tracing = False
+            before = None
+            if self.trace_allocations:
+                started_tracing = not tracemalloc.is_tracing()
+                if started_tracing:
+                    tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+            started = time.perf_counter()
+            try:
+                with profiler:
+                    yield
+            finally:
+                elapsed = time.perf_counter() - started
+                after = tracemalloc.take_snapshot() if before is not None else None
+                if started_tracing:
+                    tracemalloc.stop()
+                self._record(profiler, elapsed, before, after)
+        finally:
+            self._profiling.release()
+
+    def _record(self, profiler, elapsed, before, after):
+        """
+        Merge one sampled message into the window aggregates.
+
+        Args:
+            profiler: The per-thread profiler that ran the message
+            elapsed: Wall-clock seconds spent processing the message
+            before: tracemalloc snapshot taken before processing, or None
+            after: tracemalloc snapshot taken after processing, or None
+        """
+        diff = []
+        if before is not None:
+            after = after.filter_traces(self._tracemalloc_filters)
+            before = before.filter_traces(self._tracemalloc_filters)
+            diff = after.compare_to(before, "lineno")
+        with self._lock:
+            for key, (calls, own, cumulative) in profiler.stats.items():
+                stat = self._stats.get(key)
+                if stat is None:
+                    self._stats[key] = [calls, own, cumulative]
+                else:
+                    stat[0] += calls
+                    stat[1] += own
+                    stat[2] += cumulative
+            self._samples += 1
+            self._elapsed += elapsed
+            for stat in diff:
+                if stat.size_diff > 0:
+                    site = str(stat.traceback[0])
+                    self._alloc_bytes[site] += stat.size_diff
+                    self._alloc_count[site] += max(stat.count_diff, 0)
+
+    def _end_window(self, restart: bool = True):
+        """
+        Close the current window, write its report and optionally reopen it.
+
+        Args:
+            restart: Reopen a window when continuous profiling is configured
+        """
+        with self._lock:
+            self._active_rate = 0.0
+            self._timer = None
+            stats, samples, elapsed = self._stats, self._samples, self._elapsed
+            alloc_bytes, alloc_count = self._alloc_bytes, self._alloc_count
+            opened = self._opened
+            self._reset()
+
+        if samples:
+            try:
+                path = self._write_report(
+                    stats, samples, elapsed, alloc_bytes, alloc_count, opened
+                )
+            except Exception as e:
+                # A failed report must not stop continuous sampling or shutdown
+                path = None
+                self.logger.error(f"Could not write profiling report: {e}")
+            self.logger.info(
+                "Profiling window closed",
+                samples=samples,
+                mean_ms=round(elapsed / samples * 1000, 3),
+                report=path,
+            )
+        else:
+            self.logger.info("Profiling window closed without samples")
+
+        if restart and self.sample_rate > 0:
+            self.start_window(self.sample_rate)
+
+    def _write_report(self, stats, samples, elapsed, alloc_bytes, alloc_count, opened):
+        """
+        Write the aggregated window statistics to a report file.
+
+        Returns:
+            str: Path of the written report
+        """
+        os.makedirs(self.report_dir, exist_ok=True)
+        path = os.path.join(
+            self.report_dir, f"profile-{int(time.time())}-{os.getpid()}.txt"
+        )
+        out = io.StringIO()
+        out.write(f"Profiling window: {time.monotonic() - opened:.1f}s\n")
+        out.write(f"Sampled messages: {samples}\n")
+        out.write(f"Mean processing time: {elapsed / samples * 1000:.3f} ms\n\n")
+
+        out.write(
+            f"Top {self.top_n} functions by cumulative time "
+            "(sampled message thread only)\n"
+        )
+        out.write(f"{'calls':>10} {'own ms':>12} {'cum ms':>12}  function\n")
+        top_functions = sorted(stats.items(), key=lambda kv: kv[1][2], reverse=True)
+        for (filename, line, name), (calls, own, cumulative) in top_functions[
+            : self.top_n
+        ]:
+            where = name if filename == "~" else f"{filename}:{line}({name})"
+            out.write(
+                f"{calls:10d} {own * 1000:12.3f} {cumulative * 1000:12.3f}  {where}\n"
+            )
+        out.write("\n")
+
+        if not self.trace_allocations:
+            out.write("Allocation tracing disabled (PUBSUB_PROFILE_ALLOCATIONS=0)\n")
+        else:
+            out.write(
+                f"Top {self.top_n} allocation sites (per sampled message, "
+                "process-wide: includes allocations of concurrent workers)\n"
+            )
+        top_sites = sorted(alloc_bytes.items(), key=lambda kv: kv[1], reverse=True)
+        for site, size in top_sites[: self.top_n]:
+            blocks = alloc_count[site] / samples
+            out.write(f"{size / samples:12.1f} B {blocks:10.1f} blocks  {site}\n")
+
+        with open(path, "w") as f:
+            f.write(out.getvalue())
+        return path
+
+    def _reset(self):
+        """
+        Clear the window aggregates.
+        """
+        self._stats: dict[tuple, list] = {}
+        self._samples = 0
+        self._elapsed = 0.0
+        self._alloc_bytes = defaultdict(int)
+        self._alloc_count = defaultdict(int)
+        self._opened = time.monotonic()
@@ -0,0 +1,264 @@
+"""
+Message Tracing Module
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+import structlog
+from config.config_manager import ConfigManager
+from common.logger_manager import LoggerManager
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+
+
+class Trace:
+    """
+    Tracing context of one Pub/Sub message.
+
+    Every message gets a trace id for log correlation. Only sampled traces
+    record stage timings, taken from the monotonic clock as offsets from
+    the moment the message was received, and are exported as spans.
+    """
+
+    __slots__ = (
+        "trace_id", "message_id", "sampled", "started", "started_unix",
+        "stages", "dropped_stages", "attributes",
+    )
+
+    max_stages = 64
+
+    def __init__(self, trace_id: str, message_id: str, sampled: bool):
+        """
+        Initialize the trace.
+
+        Args:
+            trace_id: Identifier shared by every log line of the message
+            message_id: Pub/Sub message id
+            sampled: Whether stage timings are recorded and exported
+        """
+        self.trace_id = trace_id
+        self.message_id = message_id
+        self.sampled = sampled
+        self.started = time.monotonic()
+        self.started_unix = time.time()
+        self.stages: list[tuple[str, float, float]] = []
+        self.dropped_stages = 0
+        self.attributes: dict = {}
+
+    def record(self, name: str, start: float, end: float) -> None:
+        """
+        Record a completed stage of a sampled trace.
+
+        Args:
+            name: Stage name
+            start: Monotonic start time
+            end: Monotonic end time
+        """
+        if not self.sampled:
+            return
+        # Large batches would otherwise grow a span without bound
+        if len(self.stages) >= self.max_stages:
+            self.dropped_stages += 1
+            return
+        self.stages.append((name, start, end))
+
+    def to_span(self, outcome: str, end: float) -> dict:
+        """
+        Convert the trace into an exportable span record.
+
+        Args:
+            outcome: How processing ended, e.g. ``ack`` or ``nack``
+            end: Monotonic completion time
+
+        Returns:
+            dict: JSON-serializable span
+        """
+        return {
+            "trace_id": self.trace_id,
+            "message_id": self.message_id,
+            "start_unix": round(self.started_unix, 6),
+            "duration_ms": round((end - self.started) * 1000, 3),
+            "outcome": outcome,
+            **self.attributes,
+            "stages": [
+                {
+                    "name": name,
+                    "offset_ms": round((start - self.started) * 1000, 3),
+                    "duration_ms": round((stop - start) * 1000, 3),
+                }
+                for name, start, stop in self.stages
+            ],
+            "dropped_stages": self.dropped_stages,
+        }
+
+
+def current_trace() -> Optional[Trace]:
+    """
+    Return the trace of the message being processed in this context.
+
+    Returns:
+        Optional[Trace]: The active trace, or None outside message processing
+    """
+    return _current_trace.get()
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a processing stage of the current message.
+
+    Outside message processing or for unsampled traces this only costs a
+    context variable lookup.
+
+    Args:
+        name: Stage name
+    """
+    trace = _current_trace.get()
+    if trace is None or not trace.sampled:
+        yield
+        return
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        trace.record(name, start, time.monotonic())
+
+
+@contextmanager
+def activate(trace: Trace) -> Iterator[Trace]:
+    """
+    Make a trace current and bind its id into structlog for this context.
+
+    Args:
+        trace: Trace to activate
+
+    Yields:
+        Trace: The activated trace
+    """
+    token = _current_trace.set(trace)
+    log_tokens = structlog.contextvars.bind_contextvars(
+        trace_id=trace.trace_id, message_id=trace.message_id
+    )
+    try:
+        yield trace
+    finally:
+        structlog.contextvars.reset_contextvars(**log_tokens)
+        _current_trace.reset(token)
+
+
+class FileSpanExporter:
+    """
+    Appends completed spans to a JSON-lines file in batches.
+    """
+
+    def __init__(self, path: str, batch_size: int = 100):
+        """
+        Initialize the exporter.
+
+        Args:
+            path: Span file path
+            batch_size: Number of spans buffered before they are written
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.exported = 0
+        self._buffer: list[dict] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: dict) -> None:
+        """
+        Buffer a span, writing the buffer once it is full.
+
+        Args:
+            span: Span record
+        """
+        with self._lock:
+            self._buffer.append(span)
+            if len(self._buffer) < self.batch_size:
+                return
+            spans, self._buffer = self._buffer, []
+        self._write(spans)
+
+    def flush(self) -> None:
+        """
+        Write every buffered span.
+        """
+        with self._lock:
+            spans, self._buffer = self._buffer, []
+        if spans:
+            self._write(spans)
+
+    def _write(self, spans: list[dict]) -> None:
+        """
+        Append spans to the file.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(json.dumps(span) + "\n" for span in spans)
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(lines)
+            self.exported += len(spans)
+
+
+class Tracer:
+    """
+    Creates message traces and exports the sampled ones.
+    """
+
+    def __init__(self, config_manager: ConfigManager, logger_manager: LoggerManager):
+        """
+        Initialize the tracer.
+
+        Args:
+            config_manager: Configuration manager for accessing settings
+            logger_manager: Logger manager for structured logging
+        """
+        self.sample_rate = config_manager.trace_sample_rate
+        self.exporter = FileSpanExporter(config_manager.trace_export_path)
+        self.logger = logger_manager.get_logger(__name__)
+
+    def start_trace(self, message_id: str, trace_id: Optional[str] = None) -> Trace:
+        """
+        Create the trace of a newly received message.
+
+        Args:
+            message_id: Pub/Sub message id
+            trace_id: Trace id propagated by the publisher, generated if None
+
+        Returns:
+            Trace: New trace, sampled according to the sampling rate
+        """
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        return Trace(trace_id or os.urandom(16).hex(), message_id, sampled)
+
+    def finish(self, trace: Trace, outcome: str) -> None:
+        """
+        Complete a trace and export it if sampled.
+
+        Args:
+            trace: Trace of a processed message
+            outcome: How processing ended, e.g. ``ack`` or ``nack``
+        """
+        if not trace.sampled:
+            return
+        try:
+            self.exporter.export(trace.to_span(outcome, time.monotonic()))
+        except Exception as e:
+            self.logger.error(f"Could not export span: {e}")
+
+    def close(self) -> None:
+        """
+        Flush spans still buffered by the exporter.
+        """
+        try:
+            self.exporter.flush()
+        except Exception as e:
+            self.logger.error(f"Could not export spans: {e}")
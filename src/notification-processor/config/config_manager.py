@@ -23,6 +23,58 @@ class ConfigManager:
         self.topic_id = os.environ.get("PUBSUB_TOPIC_ID", "unkonwn")
         self.subscription_id = os.environ.get("PUBSUB_SUBSCRIPTION_ID", "unknown")
         self.max_messages = int(os.environ.get("PUBSUB_MAX_MESSAGES", "100"))
+        self.scheduler_workers = int(os.environ.get("PUBSUB_SCHEDULER_WORKERS", "10"))
+        self.drain_timeout = float(
+            os.environ.get("PUBSUB_DRAIN_TIMEOUT_SECONDS", "20")
+        )
+        self.profile_sample_rate = float(
+            os.environ.get("PUBSUB_PROFILE_SAMPLE_RATE", "0")
+        )
+        self.profile_signal_sample_rate = float(
+            os.environ.get("PUBSUB_PROFILE_SIGNAL_SAMPLE_RATE", "0.1")
+        )
+        self.profile_window_seconds = float(
+            os.environ.get("PUBSUB_PROFILE_WINDOW_SECONDS", "60")
+        )
+        # tracemalloc traces every thread, not only the sampled message
+        self.profile_allocations = os.environ.get(
+            "PUBSUB_PROFILE_ALLOCATIONS", "0"
+        ).lower() not in ("0", "false", "no")
+        self.profile_report_dir = os.environ.get(
+            "PUBSUB_PROFILE_REPORT_DIR", "/tmp/notification-processor"
+        )
+        self.trace_sample_rate = float(
+            os.environ.get("PUBSUB_TRACE_SAMPLE_RATE", "0.01")
+        )
+        self.trace_export_path = os.environ.get(
+            "PUBSUB_TRACE_EXPORT_PATH", "/tmp/notification-processor/spans.jsonl"
+        )
+        self.notification_targets = [
+            target.strip()
+            for target in os.environ.get("PUBSUB_NOTIFY_TARGETS", "").split(",")
+            if target.strip()
+        ]
+        self.notify_limit_per_host = int(
+            os.environ.get("PUBSUB_NOTIFY_LIMIT_PER_HOST", "4")
+        )
+        self.notify_linger = float(
+            os.environ.get("PUBSUB_NOTIFY_LINGER_SECONDS", "0.05")
+        )
+        self.notify_max_attempts = int(
+            os.environ.get("PUBSUB_NOTIFY_MAX_ATTEMPTS", "3")
+        )
+        self.notify_retry_backoff = float(
+            os.environ.get("PUBSUB_NOTIFY_RETRY_BACKOFF_SECONDS", "0.5")
+        )
+        self.notify_close_timeout = float(
+            os.environ.get("PUBSUB_NOTIFY_CLOSE_TIMEOUT_SECONDS", "10")
+        )
+        self.incident_store_capacity = int(
+            os.environ.get("PUBSUB_INCIDENT_STORE_CAPACITY", "100000")
+        )
+        self.incident_snapshot_path = os.environ.get(
+            "PUBSUB_INCIDENT_SNAPSHOT_PATH", ""
+        )
         self.logger = logger_manager.get_logger(__name__)
 
     def load_config(self, config_path=None):
@@ -56,4 +108,6 @@ class ConfigManager:
             "topic_id": self.topic_id,
             "subscription_id": self.subscription_id,
             "max_messages": self.max_messages,
+            "drain_timeout": self.drain_timeout,
+            "incident_snapshot_path": self.incident_snapshot_path,
         }
@@ -3,14 +3,29 @@ Dependency Injection Container Module
 """
 
 from dependency_injector import containers, providers
+from adapters.delivery import NotificationDelivery
+from adapters.smtp import SmtpSender
+from adapters.webhook import WebhookSender
 from application.commands.create_incident import (
     CreateIncidentCommand,
     CreateIncidentCommandHandler,
 )
 from application.commands.dispatcher import CommandDispatcher
 from application.commands.factory import CommandFactory
+from application.commands.resolve_incident import (
+    ResolveIncidentCommand,
+    ResolveIncidentCommandHandler,
+)
+from application.commands.update_incident import (
+    UpdateIncidentCommand,
+    UpdateIncidentCommandHandler,
+)
 from config.config_manager import ConfigManager
 from common.logger_manager import LoggerManager
+from common.profiler import MessageProfiler
+from common.tracing import Tracer
+from domain.incident_store import IncidentStore
+from infra.priority_scheduler import PriorityScheduler
 
 class Container(containers.DeclarativeContainer):
     """
@@ -25,10 +40,75 @@ class Container(containers.DeclarativeContainer):
         logger_manager=logger_manager,
     )
 
+    message_profiler = providers.Singleton(
+        MessageProfiler,
+        config_manager=config_manager,
+        logger_manager=logger_manager,
+    )
+
+    tracer = providers.Singleton(
+        Tracer,
+        config_manager=config_manager,
+        logger_manager=logger_manager,
+    )
+
+    priority_scheduler = providers.Singleton(
+        PriorityScheduler,
+        logger_manager=logger_manager,
+        workers=config_manager.provided.scheduler_workers,
+    )
+
+    webhook_sender = providers.Singleton(
+        WebhookSender,
+        limit_per_host=config_manager.provided.notify_limit_per_host,
+    )
+
+    smtp_sender = providers.Singleton(
+        SmtpSender,
+        pool_size=config_manager.provided.notify_limit_per_host,
+    )
+
+    notification_delivery = providers.Singleton(
+        NotificationDelivery,
+        logger_manager=logger_manager,
+        senders=providers.Dict(
+            http=webhook_sender,
+            https=webhook_sender,
+            smtp=smtp_sender,
+        ),
+        limit_per_host=config_manager.provided.notify_limit_per_host,
+        linger=config_manager.provided.notify_linger,
+        targets=config_manager.provided.notification_targets,
+        max_attempts=config_manager.provided.notify_max_attempts,
+        retry_backoff=config_manager.provided.notify_retry_backoff,
+        close_timeout=config_manager.provided.notify_close_timeout,
+    )
+
+    incident_store = providers.Singleton(
+        IncidentStore,
+        max_incidents=config_manager.provided.incident_store_capacity,
+    )
+
     create_incident_handler = providers.Factory(
         CreateIncidentCommandHandler,
         config_manager=config_manager,
-        logger_manager=logger_manager
+        logger_manager=logger_manager,
+        notification_delivery=notification_delivery,
+        incident_store=incident_store,
+    )
+
+    update_incident_handler = providers.Factory(
+        UpdateIncidentCommandHandler,
+        logger_manager=logger_manager,
+        incident_store=incident_store,
+    )
+
+    resolve_incident_handler = providers.Factory(
+        ResolveIncidentCommandHandler,
+        config_manager=config_manager,
+        logger_manager=logger_manager,
+        notification_delivery=notification_delivery,
+        incident_store=incident_store,
     )
 
     command_factory = providers.Singleton(
@@ -43,6 +123,12 @@ class Container(containers.DeclarativeContainer):
                 CreateIncidentCommand: (
                     create_incident_handler,
                 ),
+                UpdateIncidentCommand: (
+                    update_incident_handler,
+                ),
+                ResolveIncidentCommand: (
+                    resolve_incident_handler,
+                ),
             }
         ),
     )
@@ -0,0 +1,15 @@
+"""
+Domain Package
+"""
+
+from .incident import Incident, IncidentStatus
+from .incident_store import (IncidentNotFoundError, IncidentStore,
+    IncidentStoreFullError)
+
+__all__ = [
+    'Incident',
+    'IncidentStatus',
+    'IncidentNotFoundError',
+    'IncidentStore',
+    'IncidentStoreFullError'
+]
@@ -0,0 +1,79 @@
+"""
+Incident Domain Model Module
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional
+
+
+class IncidentStatus(IntEnum):
+    """
+    Lifecycle states of an incident.
+    """
+
+    OPEN = 0
+    ACKNOWLEDGED = 1
+    RESOLVED = 2
+
+
+@dataclass(slots=True)
+class Incident:
+    """
+    An incident tracked by the notification processor.
+
+    Attributes:
+        incident_id: Unique incident identifier
+        description: Human-readable description of the incident
+        status: Current lifecycle state
+        fingerprint: Deduplication key supplied by the alert source
+        service: Service the incident belongs to
+        severity: Incident severity such as ``SEV1``
+        created_at: Creation time as a Unix timestamp
+        updated_at: Last change time as a Unix timestamp
+        resolved_at: Resolution time as a Unix timestamp, if resolved
+    """
+
+    incident_id: str
+    description: str
+    status: IncidentStatus = IncidentStatus.OPEN
+    fingerprint: Optional[str] = None
+    service: Optional[str] = None
+    severity: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+    resolved_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        """
+        Convert the incident to a JSON-serializable dictionary.
+
+        Returns:
+            dict: Incident fields with the status as its name
+        """
+        return {
+            "incident_id": self.incident_id,
+            "description": self.description,
+            "status": self.status.name,
+            "fingerprint": self.fingerprint,
+            "service": self.service,
+            "severity": self.severity,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "resolved_at": self.resolved_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Incident":
+        """
+        Build an incident from the output of ``to_dict``.
+
+        Args:
+            data: Serialized incident
+
+        Returns:
+            Incident: The restored incident
+        """
+        data = dict(data)
+        data["status"] = IncidentStatus[data.get("status", "OPEN")]
+        return cls(**data)
@@ -0,0 +1,555 @@
+"""
+In-Memory Indexed Incident Store Module
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Iterator, Optional
+from domain.incident import Incident, IncidentStatus
+
+SNAPSHOT_VERSION = 1
+
+
+class IncidentNotFoundError(KeyError):
+    """
+    Raised when an incident id is not in the store.
+    """
+
+
+class IncidentStoreFullError(RuntimeError):
+    """
+    Raised when the store is full and no resolved incident can be evicted.
+    """
+
+
+class _Bitset:
+    """
+    Fixed-size bitset over a bytearray with O(1) add, discard and lookup.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, size: int):
+        self._bits = bytearray((size + 7) // 8)
+
+    def add(self, index: int) -> None:
+        self._bits[index >> 3] |= 1 << (index & 7)
+
+    def discard(self, index: int) -> None:
+        self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self._bits[index >> 3] & (1 << (index & 7)))
+
+    def count(self) -> int:
+        return int.from_bytes(self._bits, "little").bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        value = int.from_bytes(self._bits, "little")
+        while value:
+            lowest = value & -value
+            yield lowest.bit_length() - 1
+            value ^= lowest
+
+
+class IncidentStore:
+    """
+    Bounded in-memory incident store with O(1) lifecycle operations.
+
+    Incidents live in a fixed array of slots. Hash indexes map incident ids
+    to slots, fingerprints to the active (unresolved) incident and services
+    to their incident ids; one bitset per status marks which slots are in
+    that state. When the store is full the least recently resolved incident
+    is evicted. The store can be saved to and rebuilt from a JSON-lines
+    snapshot file. All operations are thread-safe. Incidents go in and come
+    out as copies, so callers never hold the stored objects and cannot
+    change them, or their indexes, outside the lock.
+    """
+
+    # Attributes holding the contents and indexes, swapped in by load
+    _STATE = (
+        "_slots", "_free", "_slot_of", "_by_fingerprint", "_by_service",
+        "_status", "_resolved", "evicted",
+    )
+
+    def __init__(self, max_incidents: int = 100_000):
+        """
+        Initialize the incident store.
+
+        Args:
+            max_incidents: Maximum number of incidents kept in memory
+        """
+        self.max_incidents = max_incidents
+        self.evicted = 0
+        self._lock = threading.Lock()
+        self._reset()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._slot_of)
+
+    def get(self, incident_id: str) -> Optional[Incident]:
+        """
+        Look up an incident by id.
+
+        Args:
+            incident_id: Incident identifier
+
+        Returns:
+            Optional[Incident]: The incident, or None if unknown
+        """
+        with self._lock:
+            slot = self._slot_of.get(incident_id)
+            return None if slot is None else copy.copy(self._slots[slot])
+
+    def find_by_fingerprint(self, fingerprint: str) -> Optional[Incident]:
+        """
+        Look up the unresolved incident with a fingerprint.
+
+        Args:
+            fingerprint: Deduplication key from the alert source
+
+        Returns:
+            Optional[Incident]: The active incident, or None
+        """
+        with self._lock:
+            incident_id = self._by_fingerprint.get(fingerprint)
+            if incident_id is None:
+                return None
+            return copy.copy(self._slots[self._slot_of[incident_id]])
+
+    def find(
+        self, incident_id: Optional[str] = None, fingerprint: Optional[str] = None
+    ) -> Optional[Incident]:
+        """
+        Look up an incident by id, falling back to the active fingerprint.
+
+        Args:
+            incident_id: Incident identifier
+            fingerprint: Deduplication key from the alert source
+
+        Returns:
+            Optional[Incident]: The incident, or None if neither matches
+        """
+        incident = self.get(incident_id) if incident_id else None
+        if incident is None and fingerprint:
+            incident = self.find_by_fingerprint(fingerprint)
+        return incident
+
+    def by_service(
+        self, service: str, status: Optional[IncidentStatus] = None
+    ) -> list[Incident]:
+        """
+        Return the incidents of a service, optionally filtered by status.
+
+        Args:
+            service: Service name
+            status: Only return incidents in this state
+
+        Returns:
+            list[Incident]: Matching incidents
+        """
+        with self._lock:
+            slots = (self._slot_of[i] for i in self._by_service.get(service, ()))
+            if status is not None:
+                bits = self._status[status]
+                slots = (slot for slot in slots if slot in bits)
+            return [copy.copy(self._slots[slot]) for slot in slots]
+
+    def by_status(self, status: IncidentStatus) -> list[Incident]:
+        """
+        Return every incident in a state.
+
+        Args:
+            status: Lifecycle state
+
+        Returns:
+            list[Incident]: Matching incidents
+        """
+        with self._lock:
+            return [copy.copy(self._slots[slot]) for slot in self._status[status]]
+
+    def count(self, status: IncidentStatus) -> int:
+        """
+        Count the incidents in a state.
+
+        Args:
+            status: Lifecycle state
+
+        Returns:
+            int: Number of incidents
+        """
+        with self._lock:
+            return self._status[status].count()
+
+    def add(self, incident: Incident) -> Incident:
+        """
+        Insert a new incident, evicting a resolved one if the store is full.
+
+        Args:
+            incident: Incident to insert
+
+        Returns:
+            Incident: The stored incident
+
+        Raises:
+            ValueError: If an incident with the same id, or an unresolved one
+                        with the same fingerprint, exists
+            IncidentStoreFullError: If the store is full of unresolved incidents
+        """
+        with self._lock:
+            if incident.incident_id in self._slot_of:
+                raise ValueError(f"Incident {incident.incident_id} already exists")
+            if self._active_duplicate(incident) is not None:
+                raise ValueError(
+                    f"Fingerprint {incident.fingerprint} already has an active incident"
+                )
+            return copy.copy(self._insert(incident))
+
+    def add_or_get(
+        self, incident: Incident, now: Optional[float] = None
+    ) -> tuple[Incident, bool]:
+        """
+        Insert an incident unless it duplicates one already stored.
+
+        The duplicate check and the insert happen under one lock, so
+        concurrent re-fires of an alert create a single incident.
+
+        Args:
+            incident: Incident to insert
+            now: Refresh time of an existing duplicate, defaults to now
+
+        Returns:
+            tuple[Incident, bool]: The stored incident, and True if it was
+                                   inserted rather than found
+
+        Raises:
+            IncidentStoreFullError: If the store is full of unresolved incidents
+        """
+        with self._lock:
+            slot = self._slot_of.get(incident.incident_id)
+            if slot is None:
+                existing = self._active_duplicate(incident)
+            else:
+                existing = self._slots[slot]
+            if existing is not None:
+                existing.updated_at = time.time() if now is None else now
+                return copy.copy(existing), False
+            return copy.copy(self._insert(incident)), True
+
+    def update(
+        self,
+        incident_id: str,
+        description: Optional[str] = None,
+        severity: Optional[str] = None,
+        status: Optional[IncidentStatus] = None,
+        now: Optional[float] = None,
+    ) -> Incident:
+        """
+        Change an incident's fields or status.
+
+        Args:
+            incident_id: Incident identifier
+            description: New description, unchanged if None
+            severity: New severity, unchanged if None
+            status: New status, unchanged if None
+            now: Change time, defaults to the current time
+
+        Returns:
+            Incident: The updated incident
+
+        Raises:
+            IncidentNotFoundError: If the incident is unknown
+            ValueError: If reopening would give a fingerprint a second
+                        active incident
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            slot = self._slot_of.get(incident_id)
+            if slot is None:
+                raise IncidentNotFoundError(incident_id)
+            incident = self._slots[slot]
+            if (
+                status is not None
+                and status != IncidentStatus.RESOLVED
+                and incident.status == IncidentStatus.RESOLVED
+            ):
+                holder = (
+                    self._by_fingerprint.get(incident.fingerprint)
+                    if incident.fingerprint
+                    else None
+                )
+                if holder is not None and holder != incident_id:
+                    raise ValueError(
+                        f"Cannot reopen {incident_id}: fingerprint "
+                        f"{incident.fingerprint} is held by {holder}"
+                    )
+            if description is not None:
+                incident.description = description
+            if severity is not None:
+                incident.severity = severity
+            if status is not None and status != incident.status:
+                self._set_status(slot, incident, status, now)
+            incident.updated_at = now
+            return copy.copy(incident)
+
+    def resolve(self, incident_id: str, now: Optional[float] = None) -> Incident:
+        """
+        Mark an incident as resolved.
+
+        Args:
+            incident_id: Incident identifier
+            now: Resolution time, defaults to the current time
+
+        Returns:
+            Incident: The resolved incident
+
+        Raises:
+            IncidentNotFoundError: If the incident is unknown
+        """
+        return self.update(incident_id, status=IncidentStatus.RESOLVED, now=now)
+
+    def resolve_active(
+        self,
+        incident_id: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+        now: Optional[float] = None,
+    ) -> tuple[Optional[Incident], bool]:
+        """
+        Resolve an incident found by id or active fingerprint, atomically.
+
+        The lookup, the status check and the resolution happen under one
+        lock, so concurrent resolves of the same incident change it once.
+
+        Args:
+            incident_id: Incident identifier
+            fingerprint: Deduplication key, used when the id does not match
+            now: Resolution time, defaults to the current time
+
+        Returns:
+            tuple[Optional[Incident], bool]: The incident, or None if
+                                             unknown, and True if this call
+                                             resolved it
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            slot = self._slot_of.get(incident_id) if incident_id else None
+            if slot is None and fingerprint:
+                active_id = self._by_fingerprint.get(fingerprint)
+                slot = None if active_id is None else self._slot_of[active_id]
+            if slot is None:
+                return None, False
+            incident = self._slots[slot]
+            if incident.status == IncidentStatus.RESOLVED:
+                return copy.copy(incident), False
+            self._set_status(slot, incident, IncidentStatus.RESOLVED, now)
+            incident.updated_at = now
+            return copy.copy(incident), True
+
+    def save(self, path: str) -> int:
+        """
+        Write a snapshot of every incident to a JSON-lines file.
+
+        The file is written next to its destination and renamed into place
+        so a crash never leaves a truncated snapshot.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            int: Number of incidents written
+        """
+        with self._lock:
+            records = [
+                self._slots[slot].to_dict() for slot in self._slot_of.values()
+            ]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps({"version": SNAPSHOT_VERSION}) + "\n")
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, path)
+        return len(records)
+
+    def load(self, path: str) -> int:
+        """
+        Replace the store contents with a snapshot file.
+
+        The snapshot is rebuilt into a fresh store and swapped in only once
+        every record was inserted, so a bad snapshot leaves the current
+        contents untouched.
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            int: Number of incidents loaded
+
+        Raises:
+            ValueError: If the snapshot version is not supported or its
+                        records conflict
+            IncidentStoreFullError: If the snapshot has more unresolved
+                                    incidents than the store holds
+        """
+        with open(path, "r") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(
+                    f"Unsupported snapshot version: {header.get('version')}"
+                )
+            incidents = [
+                Incident.from_dict(json.loads(line)) for line in f if line.strip()
+            ]
+        # Resolved incidents go first, oldest first, so they are evicted first
+        incidents.sort(
+            key=lambda i: (i.status != IncidentStatus.RESOLVED, i.resolved_at or 0.0)
+        )
+        staged = IncidentStore(self.max_incidents)
+        for incident in incidents:
+            staged.add(incident)
+        with self._lock:
+            for name in self._STATE:
+                setattr(self, name, getattr(staged, name))
+        return len(incidents)
+
+    def _active_duplicate(self, incident: Incident) -> Optional[Incident]:
+        """
+        Return the unresolved incident sharing a fingerprint. Caller holds
+        the lock.
+        """
+        if not incident.fingerprint or incident.status == IncidentStatus.RESOLVED:
+            return None
+        incident_id = self._by_fingerprint.get(incident.fingerprint)
+        return None if incident_id is None else self._slots[self._slot_of[incident_id]]
+
+    def _insert(self, incident: Incident) -> Incident:
+        """
+        Place an incident in a slot and index it. Caller holds the lock.
+
+        Raises:
+            IncidentStoreFullError: If the store is full of unresolved incidents
+        """
+        if not self._free and len(self._slots) >= self.max_incidents:
+            if not self._evict_one():
+                raise IncidentStoreFullError(
+                    f"Incident store is full "
+                    f"({self.max_incidents} unresolved incidents)"
+                )
+        incident = copy.copy(incident)
+        slot = self._free.pop() if self._free else len(self._slots)
+        if slot == len(self._slots):
+            self._slots.append(incident)
+        else:
+            self._slots[slot] = incident
+        self._slot_of[incident.incident_id] = slot
+        self._status[incident.status].add(slot)
+        if incident.service:
+            self._by_service[incident.service].add(incident.incident_id)
+        if incident.status == IncidentStatus.RESOLVED:
+            self._push_resolved(incident.incident_id, incident.resolved_at)
+        elif incident.fingerprint:
+            self._by_fingerprint[incident.fingerprint] = incident.incident_id
+        return incident
+
+    def _set_status(
+        self, slot: int, incident: Incident, status: IncidentStatus, now: float
+    ) -> None:
+        """
+        Move an incident between status bitsets. Caller holds the lock.
+        """
+        previous = incident.status
+        self._status[previous].discard(slot)
+        self._status[status].add(slot)
+        incident.status = status
+        fingerprint = incident.fingerprint
+        if status == IncidentStatus.RESOLVED:
+            incident.resolved_at = now
+            self._push_resolved(incident.incident_id, now)
+            active_id = self._by_fingerprint.get(fingerprint) if fingerprint else None
+            if active_id == incident.incident_id:
+                del self._by_fingerprint[fingerprint]
+        elif previous == IncidentStatus.RESOLVED:
+            # Reopened: it is active again and no longer evictable
+            incident.resolved_at = None
+            if fingerprint:
+                self._by_fingerprint[fingerprint] = incident.incident_id
+
+    def _push_resolved(self, incident_id: str, resolved_at: Optional[float]) -> None:
+        """
+        Queue a resolved incident for eviction. Caller holds the lock.
+
+        Reopening and resolving an incident again leaves its earlier entry
+        behind. Once stale entries make the queue twice the store capacity
+        it is compacted, which bounds its memory at an amortized O(1) cost.
+        """
+        self._resolved.append((incident_id, resolved_at))
+        if len(self._resolved) > 2 * self.max_incidents:
+            seen = set()
+            live = deque()
+            for entry in reversed(self._resolved):
+                if entry[0] not in seen and self._is_live(*entry):
+                    seen.add(entry[0])
+                    live.appendleft(entry)
+            self._resolved = live
+
+    def _is_live(self, incident_id: str, resolved_at: Optional[float]) -> bool:
+        """
+        Check that an eviction entry matches the incident's current state.
+        Caller holds the lock.
+        """
+        slot = self._slot_of.get(incident_id)
+        if slot is None:
+            return False
+        incident = self._slots[slot]
+        return (
+            incident.status == IncidentStatus.RESOLVED
+            and incident.resolved_at == resolved_at
+        )
+
+    def _evict_one(self) -> bool:
+        """
+        Remove the least recently resolved incident. Caller holds the lock.
+
+        Returns:
+            bool: True if an incident was evicted
+        """
+        while self._resolved:
+            incident_id, resolved_at = self._resolved.popleft()
+            # Skip stale entries for incidents reopened or resolved again later
+            if not self._is_live(incident_id, resolved_at):
+                continue
+            slot = self._slot_of[incident_id]
+            incident = self._slots[slot]
+            del self._slot_of[incident_id]
+            self._status[incident.status].discard(slot)
+            if incident.service:
+                ids = self._by_service[incident.service]
+                ids.discard(incident_id)
+                if not ids:
+                    del self._by_service[incident.service]
+            self._slots[slot] = None
+            self._free.append(slot)
+            self.evicted += 1
+            return True
+        return False
+
+    def _reset(self) -> None:
+        """
+        Clear all incidents and indexes. Caller holds the lock.
+        """
+        self._slots: list[Optional[Incident]] = []
+        self._free: list[int] = []
+        self._slot_of: dict[str, int] = {}
+        self._by_fingerprint: dict[str, str] = {}
+        self._by_service: dict[str, set[str]] = defaultdict(set)
+        self._status = {
+            status: _Bitset(self.max_incidents) for status in IncidentStatus
+        }
+        self._resolved: deque[tuple[str, Optional[float]]] = deque()
@@ -2,8 +2,9 @@
 Infrastructure Package
 """
 
-from .subscriber import Subscriber
+from .subscriber import DrainStats, Subscriber
 
 __all__ = [
+    'DrainStats',
     'Subscriber'
 ]
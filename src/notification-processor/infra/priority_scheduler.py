@@ -0,0 +1,287 @@
+"""
+Severity-Based Priority Scheduler Module
+"""
+
+import heapq
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+from common.logger_manager import LoggerManager
+
+
+class Lane:
+    """
+    A priority lane with its own queue, fairness weight and reserved workers.
+
+    Attributes:
+        name: Lane name, e.g. ``critical``
+        weight: Share of the unreserved workers relative to other lanes
+        reserved: Workers only this lane may use, so it never waits for
+                  lower-priority work to finish
+    """
+
+    def __init__(self, name: str, weight: int, reserved: int = 0):
+        """
+        Initialize the lane.
+
+        Args:
+            name: Lane name
+            weight: Fairness weight, higher is served more often
+            reserved: Number of workers reserved for this lane
+        """
+        self.name = name
+        self.weight = weight
+        self.reserved = reserved
+        self.queue = deque()
+        self.running = 0
+        self.shared_running = 0
+        self.pass_value = 0.0
+        self.dispatched = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+DEFAULT_LANES = (
+    Lane("critical", weight=8, reserved=2),
+    Lane("high", weight=4, reserved=1),
+    Lane("normal", weight=2),
+    Lane("low", weight=1),
+)
+
+SEVERITY_LANES = {
+    "sev1": "critical",
+    "critical": "critical",
+    "p1": "critical",
+    "sev2": "high",
+    "high": "high",
+    "p2": "high",
+    "sev3": "normal",
+    "medium": "normal",
+    "normal": "normal",
+    "p3": "normal",
+    "sev4": "low",
+    "sev5": "low",
+    "low": "low",
+    "info": "low",
+    "p4": "low",
+}
+DEFAULT_LANE = "normal"
+
+
+class PriorityScheduler:
+    """
+    Worker pool that serves work from severity lanes with weighted fairness.
+
+    Lanes with queued work sit in a heap ordered by their stride-scheduling
+    pass value, so each lane gets unreserved workers in proportion to its
+    weight and low-priority lanes are slowed but never starved. On top of
+    that every lane may have reserved workers that only it can use, which
+    keeps critical incidents moving while the shared workers are saturated.
+    Queueing delay is recorded per lane.
+    """
+
+    def __init__(
+        self,
+        logger_manager: LoggerManager,
+        workers: int = 10,
+        lanes: Optional[Iterable[Lane]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            logger_manager: Logger manager for structured logging
+            workers: Total number of worker threads
+            lanes: Lanes in descending priority order, defaults to DEFAULT_LANES
+
+        Raises:
+            ValueError: If the reservations leave no shared worker
+        """
+        lanes = DEFAULT_LANES if lanes is None else lanes
+        self._lanes = {
+            lane.name: Lane(lane.name, lane.weight, lane.reserved) for lane in lanes
+        }
+        self._order = {name: index for index, name in enumerate(self._lanes)}
+        reserved = sum(lane.reserved for lane in self._lanes.values())
+        if workers <= reserved:
+            raise ValueError(
+                f"Scheduler needs more than {reserved} workers to cover lane reservations"
+            )
+        self.workers = workers
+        self._shared_capacity = workers - reserved
+        self._shared_running = 0
+        self._heap = []
+        self._virtual_time = 0.0
+        self._cond = threading.Condition()
+        self._threads = []
+        self._stopping = False
+        self.logger = logger_manager.get_logger(__name__)
+
+    def lane_for(self, severity: Optional[str]) -> str:
+        """
+        Map a severity label to a lane name.
+
+        Args:
+            severity: Severity from a message attribute or command field
+
+        Returns:
+            str: The lane name, ``normal`` for missing or unknown severities
+        """
+        if not severity:
+            return DEFAULT_LANE
+        return SEVERITY_LANES.get(severity.strip().lower(), DEFAULT_LANE)
+
+    def start(self) -> None:
+        """
+        Start the worker threads.
+        """
+        with self._cond:
+            if self._threads:
+                return
+            self._stopping = False
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker, name=f"priority-worker-{index}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, lane_name: str, work: Callable[[], None]) -> None:
+        """
+        Queue work in a lane.
+
+        Args:
+            lane_name: Name of the lane
+            work: Zero-argument callable run on a worker thread
+
+        Raises:
+            KeyError: If the lane does not exist
+            RuntimeError: If the scheduler is shutting down
+        """
+        lane = self._lanes[lane_name]
+        with self._cond:
+            if self._stopping:
+                raise RuntimeError("Scheduler is shutting down")
+            if not lane.queue:
+                # An idle lane must not bank credit while it had no work
+                lane.pass_value = max(lane.pass_value, self._virtual_time)
+                heapq.heappush(self._heap, (lane.pass_value, self._order[lane.name], lane))
+            lane.queue.append((time.monotonic(), work))
+            self._cond.notify()
+
+    def shutdown(self, cancel_pending: bool = False, timeout: Optional[float] = None) -> int:
+        """
+        Stop the workers.
+
+        Args:
+            cancel_pending: Drop queued work instead of running it first
+            timeout: Seconds to wait for each worker thread, None waits forever
+
+        Returns:
+            int: Number of queued work items dropped
+        """
+        with self._cond:
+            self._stopping = True
+            dropped = 0
+            if cancel_pending:
+                for lane in self._lanes.values():
+                    dropped += len(lane.queue)
+                    lane.queue.clear()
+                self._heap.clear()
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout)
+        return dropped
+
+    def snapshot(self) -> dict:
+        """
+        Return per-lane queue and latency statistics.
+
+        Returns:
+            dict: Lane name mapped to queued, running, dispatched, mean and
+                  max queueing delay in milliseconds
+        """
+        with self._cond:
+            return {
+                lane.name: {
+                    "queued": len(lane.queue),
+                    "running": lane.running,
+                    "dispatched": lane.dispatched,
+                    "mean_wait_ms": round(
+                        lane.total_wait / lane.dispatched * 1000, 3
+                    ) if lane.dispatched else 0.0,
+                    "max_wait_ms": round(lane.max_wait * 1000, 3),
+                }
+                for lane in self._lanes.values()
+            }
+
+    def _worker(self) -> None:
+        """
+        Worker thread loop: take the next eligible item, run it, free the slot.
+        """
+        while True:
+            with self._cond:
+                while True:
+                    picked = self._pick()
+                    if picked is not None:
+                        break
+                    if self._stopping and not self._heap:
+                        return
+                    self._cond.wait()
+            lane, work, shared = picked
+            try:
+                work()
+            except Exception as e:
+                self.logger.error(f"Unhandled error in {lane.name} lane work: {e}")
+            finally:
+                with self._cond:
+                    lane.running -= 1
+                    if shared:
+                        lane.shared_running -= 1
+                        self._shared_running -= 1
+                    self._cond.notify_all()
+
+    def _pick(self):
+        """
+        Pop the next work item from the lane heap. Caller holds the lock.
+
+        A lane is eligible if it has a free reserved worker or a shared
+        worker is free. Among eligible lanes the one with the lowest pass
+        value wins, ties going to the higher-priority lane.
+
+        Returns:
+            tuple: (lane, work, uses_shared_worker), or None if nothing can run
+        """
+        skipped = []
+        picked = None
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            lane = entry[2]
+            # Work on shared workers does not occupy the lane's reservation
+            if lane.running - lane.shared_running < lane.reserved:
+                shared = False
+            elif self._shared_running < self._shared_capacity:
+                shared = True
+            else:
+                skipped.append(entry)
+                continue
+            enqueued_at, work = lane.queue.popleft()
+            wait = time.monotonic() - enqueued_at
+            lane.dispatched += 1
+            lane.total_wait += wait
+            lane.max_wait = max(lane.max_wait, wait)
+            lane.running += 1
+            if shared:
+                lane.shared_running += 1
+                self._shared_running += 1
+            self._virtual_time = lane.pass_value
+            lane.pass_value += 1.0 / lane.weight
+            if lane.queue:
+                heapq.heappush(self._heap, (lane.pass_value, self._order[lane.name], lane))
+            picked = (lane, work, shared)
+            break
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return picked
@@ -3,9 +3,47 @@ Google Cloud Pub/Sub Subscriber Infrastructure Module
 """
 
 import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING
 from google.cloud.pubsub_v1 import SubscriberClient
 from google.cloud.pubsub_v1.types import FlowControl
-from di.container import Container
+from application.commands.factory import (
+    PUBLISH_TIME_ATTRIBUTE,
+    SEVERITY_ATTRIBUTE,
+    TRACE_ID_ATTRIBUTE,
+)
+from common.latency import LatencyTracker
+from common.tracing import activate, stage
+
+if TYPE_CHECKING:
+    # The container wires infra providers, so import it for typing only
+    from di.container import Container
+
+
+@dataclass
+class DrainStats:
+    """
+    Summary of a graceful drain.
+
+    Attributes:
+        completed: In-flight messages that finished before the deadline
+        nacked: In-flight messages nacked because the deadline expired
+        rejected: Messages refused because draining had started; they are
+                  held unacked and nacked when the drain ends
+        duration: Seconds spent draining
+        lanes: Per-lane scheduler statistics at the end of the drain
+        latency: Publish-to-ack latency summary for stamped messages
+    """
+
+    completed: int = 0
+    nacked: int = 0
+    rejected: int = 0
+    duration: float = 0.0
+    lanes: dict = field(default_factory=dict)
+    latency: dict = field(default_factory=dict)
 
 
 class Subscriber:
@@ -17,7 +55,7 @@ class Subscriber:
         self,
         project_id: str,
         subscription_id: str,
-        container: Container,
+        container: "Container",
         max_messages: int,
     ):
         """
@@ -38,6 +76,18 @@ class Subscriber:
             project_id, subscription_id
         )
         self.logger = container.logger_manager().get_logger(__name__)
+        self.profiler = container.message_profiler()
+        self.scheduler = container.priority_scheduler()
+        self.tracer = container.tracer()
+        self._subscriber_future = None
+        self._accepting = True
+        self._inflight = {}
+        # Messages refused during a drain, None once the drain is over
+        self._held = []
+        self._inflight_cond = threading.Condition()
+        self._drain_stats = DrainStats()
+        self.e2e_latency = LatencyTracker()
+        self.latency_report_every = 1000
 
     async def run_subscriber(self):
         """
@@ -54,37 +104,55 @@ class Subscriber:
         # Define the callback here to capture self/container
         def sync_callback(message):
             """
-            Synchronous callback that bridges to async processing.
+            Synchronous callback that hands the message to its priority lane.
+
+            The message's trace starts here and travels with it to the
+            scheduler worker that processes it.
 
             Args:
                 message: Pub/Sub message to process
             """
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            try:
-                success = loop.run_until_complete(self.async_process_message(message))
-                if success:
-                    message.ack()
-                    self.logger.debug(f"Acknowledged message: {message.message_id}")
-                else:
-                    message.nack()
-                    self.logger.debug(f"Nacked message: {message.message_id}")
-            except Exception as e:
-                self.logger.error(
-                    f"Error in callback for message {message.message_id}: {e}"
-                )
-                message.nack()
+            attributes = getattr(message, "attributes", None) or {}
+            trace = self.tracer.start_trace(
+                message.message_id, attributes.get(TRACE_ID_ATTRIBUTE)
+            )
+            with activate(trace):
+                if not self._track(message):
+                    self.logger.debug(
+                        f"Draining, holding message: {message.message_id}"
+                    )
+                    self.tracer.finish(trace, "rejected")
+                    return
+                try:
+                    lane = self._classify(message)
+                    trace.attributes["lane"] = lane
+                    self.scheduler.submit(
+                        lane,
+                        partial(
+                            self._process_scheduled,
+                            message,
+                            trace,
+                            time.monotonic(),
+                        ),
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Error in callback for message {message.message_id}: {e}"
+                    )
+                    if self._release(message):
+                        message.nack()
+                    self.tracer.finish(trace, "nack")
 
-        # Configure flow control
-        flow_control = FlowControl(max_messages=100)
+        # Flow control bounds the messages leased and queued in the lanes
+        flow_control = FlowControl(max_messages=self.max_messages)
+
+        self.scheduler.start()
 
         # Start the subscriber with our sync callback that bridges to async
         subscriber_future = self.subscriber.subscribe(
             self.subscription_path, callback=sync_callback, flow_control=flow_control
         )
+        self._subscriber_future = subscriber_future
 
         loop = asyncio.get_running_loop()
         try:
@@ -98,10 +166,251 @@ class Subscriber:
             self.subscriber.close()
             self.logger.info("Subscriber closed")
 
+    async def drain(self, timeout: float) -> DrainStats:
+        """
+        Gracefully drain the subscriber before shutdown.
+
+        New deliveries are refused but kept unacked, so their leases fill
+        the flow-control budget and the streaming pull stops delivering.
+        In-flight messages are given up to ``timeout`` seconds to finish.
+        Whatever is still running afterwards is nacked together with the
+        refused messages, so Pub/Sub redelivers them promptly. The
+        streaming pull is cancelled only once the drain is over, so acks
+        from completed callbacks are still sent.
+
+        Args:
+            timeout: Maximum number of seconds to wait for in-flight messages
+
+        Returns:
+            DrainStats: Counters describing the drain
+        """
+        started = time.monotonic()
+        with self._inflight_cond:
+            self._accepting = False
+            pending = len(self._inflight)
+        self.logger.info("Draining subscriber", inflight=pending, timeout=timeout)
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._wait_for_inflight, timeout)
+
+        with self._inflight_cond:
+            leftover = list(self._inflight.values())
+            self._inflight.clear()
+            held, self._held = self._held, None
+        for message in leftover + held:
+            message.nack()
+
+        # Queued work belongs to messages nacked above; workers still busy
+        # past the deadline are daemon threads and are not waited for.
+        self.scheduler.shutdown(cancel_pending=True, timeout=0)
+
+        if self._subscriber_future is not None:
+            self._subscriber_future.cancel()
+
+        stats = self._drain_stats
+        stats.completed = pending - len(leftover)
+        stats.nacked = len(leftover)
+        stats.duration = time.monotonic() - started
+        stats.lanes = self.scheduler.snapshot()
+        stats.latency = self.e2e_latency.summary()
+        self.logger.info(
+            "Subscriber drained",
+            completed=stats.completed,
+            nacked=stats.nacked,
+            rejected=stats.rejected,
+            duration=round(stats.duration, 3),
+            lanes=stats.lanes,
+            e2e_latency=stats.latency,
+        )
+        return stats
+
+    def _track(self, message) -> bool:
+        """
+        Register a message as in flight unless the subscriber is draining.
+
+        A message refused while the drain is running is held unacked until
+        ``drain`` nacks it; one arriving after the drain is nacked at once.
+
+        Args:
+            message: Pub/Sub message about to be processed
+
+        Returns:
+            bool: True if the message was accepted, False if draining
+        """
+        with self._inflight_cond:
+            if self._accepting:
+                self._inflight[message.message_id] = message
+                return True
+            self._drain_stats.rejected += 1
+            if self._held is not None:
+                self._held.append(message)
+                return False
+        message.nack()
+        return False
+
+    def _release(self, message) -> bool:
+        """
+        Remove a message from the in-flight set.
+
+        Args:
+            message: Pub/Sub message that finished processing
+
+        Returns:
+            bool: True if the caller still owns the message and must ack/nack
+                  it, False if the drain already nacked it
+        """
+        with self._inflight_cond:
+            owned = self._inflight.pop(message.message_id, None) is not None
+            if not self._inflight:
+                self._inflight_cond.notify_all()
+            return owned
+
+    def _is_inflight(self, message) -> bool:
+        """
+        Check whether a message is still owned by this subscriber.
+
+        Args:
+            message: Pub/Sub message
+
+        Returns:
+            bool: False once the drain has nacked the message
+        """
+        with self._inflight_cond:
+            return message.message_id in self._inflight
+
+    def _classify(self, message) -> str:
+        """
+        Decide which priority lane a message is scheduled in.
+
+        The lane comes from the ``severity`` attribute so the callback
+        thread never decodes the body; decoding happens on the worker,
+        inside the profiled and traced processing path.
+
+        Args:
+            message: Pub/Sub message
+
+        Returns:
+            str: Lane name
+        """
+        attributes = getattr(message, "attributes", None) or {}
+        return self.scheduler.lane_for(attributes.get(SEVERITY_ATTRIBUTE))
+
+    def _process_scheduled(self, message, trace=None, submitted_at=None):
+        """
+        Process a message on a scheduler worker and ack or nack it.
+
+        Args:
+            message: Pub/Sub message to process
+            trace: Trace started when the message was received
+            submitted_at: Monotonic time the message entered its lane
+        """
+        if trace is None:
+            trace = self.tracer.start_trace(message.message_id)
+        with activate(trace):
+            if submitted_at is not None:
+                trace.record("queued", submitted_at, time.monotonic())
+            self.tracer.finish(trace, self._process_traced(message))
+
+    def _process_traced(self, message) -> str:
+        """
+        Run a message under its active trace and settle it.
+
+        Args:
+            message: Pub/Sub message to process
+
+        Returns:
+            str: Outcome recorded on the span
+        """
+        if not self._is_inflight(message):
+            # The drain deadline expired while the message was queued
+            return "expired"
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+        try:
+            # The task copies this context, so the trace reaches the
+            # factory, the dispatcher and the handlers
+            with stage("process"):
+                success = loop.run_until_complete(
+                    self.async_process_message(message)
+                )
+            if not self._release(message):
+                # The drain deadline expired and the message was already nacked
+                return "expired"
+            with stage("ack"):
+                if success:
+                    message.ack()
+                else:
+                    message.nack()
+            if success:
+                self.logger.debug(f"Acknowledged message: {message.message_id}")
+                self._record_e2e_latency(message)
+                return "ack"
+            self.logger.debug(f"Nacked message: {message.message_id}")
+            return "nack"
+        except Exception as e:
+            self.logger.error(
+                f"Error processing scheduled message {message.message_id}: {e}"
+            )
+            if self._release(message):
+                message.nack()
+            return "nack"
+
+    def _record_e2e_latency(self, message) -> None:
+        """
+        Record publish-to-ack latency for messages stamped by the publisher.
+
+        Args:
+            message: Acknowledged Pub/Sub message
+        """
+        attributes = getattr(message, "attributes", None) or {}
+        stamp = attributes.get(PUBLISH_TIME_ATTRIBUTE)
+        if not stamp:
+            return
+        try:
+            latency = (time.time_ns() - int(stamp)) / 1e9
+        except ValueError:
+            return
+        count = self.e2e_latency.record(latency)
+        if count % self.latency_report_every == 0:
+            self.logger.info("End-to-end latency", **self.e2e_latency.summary())
+
+    def _wait_for_inflight(self, timeout: float) -> bool:
+        """
+        Block until no messages are in flight or the timeout expires.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            bool: True if all in-flight messages completed in time
+        """
+        with self._inflight_cond:
+            return self._inflight_cond.wait_for(
+                lambda: not self._inflight, timeout=timeout
+            )
+
     async def async_process_message(self, message):
         """
         Asynchronously process a received Pub/Sub message.
 
+        Args:
+            message: Pub/Sub message to process
+
+        Returns:
+            bool: True if processing succeeded, False otherwise
+        """
+        if self.profiler.should_sample():
+            with self.profiler.profile():
+                return self._process_message(message)
+        return self._process_message(message)
+
+    def _process_message(self, message):
+        """
+        Build the command(s) carried by a message and dispatch them.
+
         Args:
             message: Pub/Sub message to process
 
@@ -111,11 +420,53 @@ class Subscriber:
         try:
             command_dispatcher = self.container.command_dispatcher()
             command_factory = self.container.command_factory()
-            command = command_factory.create(message)
-            command_dispatcher.dispatch(command)
+            if command_factory.is_batch(message):
+                self._process_batch(message, command_factory, command_dispatcher)
+            else:
+                command = command_factory.create(message)
+                command_dispatcher.dispatch(command)
 
             self.logger.debug(f"Message processed: {message.message_id}")
             return True
         except Exception as e:
             self.logger.debug(f"Error processing message {message.message_id}: {e}")
             return False
+
+    def _process_batch(self, message, command_factory, command_dispatcher):
+        """
+        Dispatch every command of a batch envelope.
+
+        Items that fail to decode or are rejected as invalid (``ValueError``)
+        are logged and skipped so a single bad item does not cause the whole
+        batch to be redelivered. Envelope-level errors and any other dispatch
+        failure propagate and lead to a nack.
+
+        Args:
+            message: Pub/Sub message carrying the batch envelope
+            command_factory: Factory used to expand the envelope
+            command_dispatcher: Dispatcher used for each command
+        """
+        processed = failed = 0
+        for item in command_factory.create_batch(message):
+            error = item.error
+            if error is None:
+                try:
+                    command_dispatcher.dispatch(item.command)
+                except ValueError as e:
+                    error = e
+            if error is None:
+                processed += 1
+            else:
+                failed += 1
+                self.logger.error(
+                    "Skipping failed batch item",
+                    message_id=message.message_id,
+                    index=item.index,
+                    error=str(error),
+                )
+        self.logger.debug(
+            "Batch processed",
+            message_id=message.message_id,
+            processed=processed,
+            failed=failed,
+        )
@@ -29,3 +29,7 @@ export PUBSUB_SUBSCRIPTION_ID=my-sub
 export PUBSUB_MAX_MESSAGES=100
 export PUBSUB_LOG_LEVEL=INFO
 export PUBSUB_LOG_FORMAT=json
+
+# Generate load against the emulator (run from src/notification-processor)
+PUBSUB_EMULATOR_HOST=localhost:8681 PUBSUB_PROJECT_ID=local-project PUBSUB_TOPIC_ID=my-topic \
+  python -m tools.publisher --rate 500 --duration 60 --create-topic
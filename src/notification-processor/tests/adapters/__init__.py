@@ -0,0 +1 @@
+# Empty file to make tests/adapters directory a Python package
@@ -0,0 +1,77 @@
+"""
+Unit tests for the CompactCommand base class.
+"""
+
+from typing import Optional
+import pytest
+from application.commands.compact import CompactCommand
+from application.commands.create_incident import CreateIncidentCommand
+
+
+class SampleCommand(CompactCommand):
+    """Compact command with required, optional and defaulted fields."""
+    name: str
+    count: int = 1
+    note: Optional[str] = None
+
+
+class TestCompactCommand:
+    """Test suite for CompactCommand class."""
+
+    def test_fields_become_slots(self):
+        """Test that instances have no __dict__."""
+        command = SampleCommand(name="a")
+
+        assert SampleCommand.__slots__ == ("name", "count", "note")
+        assert not hasattr(command, "__dict__")
+
+    def test_defaults_applied(self):
+        """Test that defaulted fields are filled in."""
+        command = SampleCommand.decode({"name": "a"})
+
+        assert command.as_dict() == {"name": "a", "count": 1, "note": None}
+
+    def test_unknown_keys_ignored(self):
+        """Test that extra payload keys are ignored."""
+        command = SampleCommand.decode({"name": "a", "type": "Sample"})
+
+        assert command == SampleCommand(name="a")
+
+    def test_missing_field_raises_value_error(self):
+        """Test that required fields are enforced."""
+        with pytest.raises(ValueError, match="SampleCommand.name is required"):
+            SampleCommand.decode({})
+
+    def test_wrong_type_raises_value_error(self):
+        """Test that field types are enforced."""
+        with pytest.raises(ValueError, match="SampleCommand.count must be int"):
+            SampleCommand.decode({"name": "a", "count": "2"})
+
+    def test_optional_accepts_none_and_value(self):
+        """Test that Optional fields accept None or the inner type."""
+        assert SampleCommand.decode({"name": "a", "note": "n"}).note == "n"
+        with pytest.raises(ValueError):
+            SampleCommand.decode({"name": "a", "note": 3})
+
+    def test_decode_json(self):
+        """Test decoding straight from JSON bytes."""
+        command = SampleCommand.decode_json(b'{"name": "a", "count": 3}')
+
+        assert command.count == 3
+
+    def test_decode_json_rejects_non_object(self):
+        """Test that non-object JSON payloads are rejected."""
+        with pytest.raises(ValueError, match="must be a JSON object"):
+            SampleCommand.decode_json(b'["a"]')
+
+    def test_create_incident_rejects_empty_description(self):
+        """Test that the validate hook runs on decode."""
+        with pytest.raises(ValueError, match="Incident description cannot be empty."):
+            CreateIncidentCommand.decode({"description": ""})
+
+    def test_create_incident_keyword_construction(self):
+        """Test that keyword construction matches the former pydantic API."""
+        command = CreateIncidentCommand(description="disk full")
+
+        assert command.description == "disk full"
+        assert repr(command).startswith("CreateIncidentCommand(description='disk full', severity=None")
@@ -0,0 +1,191 @@
+"""
+Unit tests for the CommandFactory class.
+"""
+
+import gzip
+import json
+import zlib
+import pytest
+from unittest.mock import Mock
+from application.commands.create_incident import CreateIncidentCommand
+from application.commands.factory import CommandFactory
+
+
+def make_message(data: bytes, **attributes):
+    """Create a mock Pub/Sub message with the given body and attributes."""
+    message = Mock()
+    message.data = data
+    message.attributes = attributes
+    return message
+
+
+@pytest.fixture
+def command_factory():
+    """Create a CommandFactory instance for testing."""
+    return CommandFactory()
+
+
+class TestCommandFactory:
+    """Test suite for CommandFactory class."""
+
+    def test_create_plain_message(self, command_factory):
+        """Test that an uncompressed body becomes the incident description."""
+        command = command_factory.create(make_message(b"disk full"))
+
+        assert isinstance(command, CreateIncidentCommand)
+        assert command.description == "disk full"
+
+    @pytest.mark.parametrize(
+        "encoding, compress",
+        [("gzip", gzip.compress), ("zlib", zlib.compress)],
+    )
+    def test_create_compressed_message(self, command_factory, encoding, compress):
+        """Test that gzip and zlib bodies are decompressed."""
+        message = make_message(compress(b"disk full"), **{"content-encoding": encoding})
+
+        assert command_factory.create(message).description == "disk full"
+
+    def test_create_unknown_encoding_raises_value_error(self, command_factory):
+        """Test that unsupported encodings are rejected."""
+        message = make_message(b"x", **{"content-encoding": "br"})
+
+        with pytest.raises(ValueError, match="Unsupported content encoding: br"):
+            command_factory.create(message)
+
+    def test_create_corrupt_payload_raises_value_error(self, command_factory):
+        """Test that a corrupt compressed body is rejected."""
+        message = make_message(b"not gzip", **{"content-encoding": "gzip"})
+
+        with pytest.raises(ValueError, match="Corrupt gzip payload"):
+            command_factory.create(message)
+
+    def test_create_multi_member_gzip(self, command_factory):
+        """Test that every member of a concatenated gzip body is decoded."""
+        body = gzip.compress(b"disk ") + gzip.compress(b"full")
+        message = make_message(body, **{"content-encoding": "gzip"})
+
+        assert command_factory.create(message).description == "disk full"
+
+    @pytest.mark.parametrize(
+        "encoding, compress",
+        [("gzip", gzip.compress), ("zlib", zlib.compress)],
+    )
+    def test_create_trailing_data_raises_value_error(
+        self, command_factory, encoding, compress
+    ):
+        """Test that bytes after the compressed stream are rejected."""
+        message = make_message(
+            compress(b"disk full") + b"garbage", **{"content-encoding": encoding}
+        )
+
+        with pytest.raises(ValueError, match=f"{encoding} payload"):
+            command_factory.create(message)
+
+    def test_create_enforces_decompressed_size_limit(self):
+        """Test that oversized decompressed bodies are rejected."""
+        command_factory = CommandFactory(max_decompressed_bytes=1024)
+        message = make_message(gzip.compress(b"a" * 4096), **{"content-encoding": "gzip"})
+
+        with pytest.raises(ValueError, match="exceeds 1024 bytes"):
+            command_factory.create(message)
+
+    def test_is_batch(self, command_factory):
+        """Test batch detection from the content-type attribute."""
+        assert command_factory.is_batch(make_message(b"", **{"content-type": "application/x-ndjson"}))
+        assert command_factory.is_batch(make_message(b"", **{"content-type": "application/json"}))
+        assert not command_factory.is_batch(make_message(b""))
+
+    def test_create_batch_ndjson_compressed(self, command_factory):
+        """Test that a gzip NDJSON envelope expands into commands in order."""
+        body = b'"first"\n{"type": "CreateIncident", "description": "second"}\n\n'
+        message = make_message(
+            gzip.compress(body),
+            **{"content-encoding": "gzip", "content-type": "application/x-ndjson"},
+        )
+
+        items = list(command_factory.create_batch(message))
+
+        assert [item.index for item in items] == [0, 1]
+        assert [item.command.description for item in items] == ["first", "second"]
+        assert all(item.error is None for item in items)
+
+    def test_create_batch_is_lazy(self, command_factory):
+        """Test that items are decoded only as the caller iterates."""
+        body = b'"first"\n"second"\n'
+        message = make_message(body, **{"content-type": "application/x-ndjson"})
+
+        batch = command_factory.create_batch(message)
+
+        assert next(batch).command.description == "first"
+
+    def test_create_batch_reports_bad_items_without_aborting(self, command_factory):
+        """Test the partial-failure semantic: bad items carry their error."""
+        body = json.dumps(
+            ["ok", {"type": "Unknown"}, 42, {"description": "also ok"}]
+        ).encode("utf-8")
+        message = make_message(body, **{"content-type": "application/json"})
+
+        items = list(command_factory.create_batch(message))
+
+        assert [item.command is not None for item in items] == [True, False, False, True]
+        assert "Unknown command type: Unknown" in str(items[1].error)
+        assert isinstance(items[2].error, ValueError)
+
+    def test_create_batch_truncated_envelope_fails_before_first_item(self, command_factory):
+        """Test that a truncated envelope is rejected before any item is yielded."""
+        body = b"".join(b'"item %d"\n' % i for i in range(20000))
+        compressed = gzip.compress(body)
+        message = make_message(
+            compressed[: len(compressed) // 2],
+            **{"content-encoding": "gzip", "content-type": "application/x-ndjson"},
+        )
+
+        batch = command_factory.create_batch(message)
+
+        with pytest.raises(ValueError, match="Truncated gzip payload"):
+            next(batch)
+
+    def test_create_batch_size_limit_fails_before_first_item(self):
+        """Test that the size limit past the first chunk yields no items."""
+        command_factory = CommandFactory(max_decompressed_bytes=100 * 1024)
+        body = b"".join(b'"item %d"\n' % i for i in range(20000))
+        message = make_message(
+            gzip.compress(body),
+            **{"content-encoding": "gzip", "content-type": "application/x-ndjson"},
+        )
+
+        with pytest.raises(ValueError, match="exceeds 102400 bytes"):
+            next(command_factory.create_batch(message))
+
+    def test_create_batch_bad_ndjson_line(self, command_factory):
+        """Test that an unparsable NDJSON line only fails that item."""
+        body = b'"ok"\n{not json\n"ok too"\n'
+        message = make_message(body, **{"content-type": "application/x-ndjson"})
+
+        items = list(command_factory.create_batch(message))
+
+        assert items[1].error is not None
+        assert items[2].command.description == "ok too"
+
+    def test_create_batch_non_array_envelope_raises_value_error(self, command_factory):
+        """Test that a JSON envelope that is not an array is rejected."""
+        message = make_message(b'{"description": "x"}', **{"content-type": "application/json"})
+
+        with pytest.raises(ValueError, match="must be an array"):
+            list(command_factory.create_batch(message))
+
+    def test_create_typed_json_command(self, command_factory):
+        """Test that the command-type attribute selects a JSON command."""
+        message = make_message(b'{"incident_id": "i-1"}', **{"command-type": "ResolveIncident"})
+
+        command = command_factory.create(message)
+
+        assert type(command).__name__ == "ResolveIncidentCommand"
+        assert command.incident_id == "i-1"
+
+    def test_create_unknown_command_type_raises_value_error(self, command_factory):
+        """Test that unregistered command types are rejected."""
+        message = make_message(b"{}", **{"command-type": "Bogus"})
+
+        with pytest.raises(ValueError, match="Unknown command type: Bogus"):
+            command_factory.create(message)
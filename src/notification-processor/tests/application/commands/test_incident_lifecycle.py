@@ -0,0 +1,135 @@
+"""
+Unit tests for the incident lifecycle command handlers.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+from application.commands.create_incident import (CreateIncidentCommand,
+    CreateIncidentCommandHandler)
+from application.commands.resolve_incident import (ResolveIncidentCommand,
+    ResolveIncidentCommandHandler)
+from application.commands.update_incident import (UpdateIncidentCommand,
+    UpdateIncidentCommandHandler)
+from domain.incident import IncidentStatus
+from domain.incident_store import IncidentStore
+
+
+@pytest.fixture
+def mock_logger_manager():
+    """Create a mock logger manager."""
+    logger_manager = Mock()
+    logger_manager.get_logger.return_value = Mock()
+    return logger_manager
+
+
+@pytest.fixture
+def config_manager():
+    """Create a config manager stub with one notification target."""
+    config = Mock()
+    config.notification_targets = ["http://hooks.example/incidents"]
+    return config
+
+
+@pytest.fixture
+def store():
+    """Create an IncidentStore instance for testing."""
+    return IncidentStore(max_incidents=16)
+
+
+@pytest.fixture
+def handlers(config_manager, mock_logger_manager, store):
+    """Create the create, update and resolve handlers sharing one store."""
+    delivery = Mock()
+    return (
+        CreateIncidentCommandHandler(config_manager, mock_logger_manager, delivery, store),
+        UpdateIncidentCommandHandler(mock_logger_manager, store),
+        ResolveIncidentCommandHandler(config_manager, mock_logger_manager, delivery, store),
+        delivery,
+    )
+
+
+class TestIncidentLifecycle:
+    """Test suite for the create, update and resolve handlers."""
+
+    def test_create_stores_incident_and_notifies(self, handlers, store):
+        """Test that a new incident is indexed and a notification submitted."""
+        create, _, _, delivery = handlers
+
+        create.handle(CreateIncidentCommand(description="db down", incident_id="i-1", service="db"))
+
+        assert store.get("i-1").service == "db"
+        delivery.submit.assert_called_once()
+        assert delivery.submit.call_args.args[0].subject == "Incident i-1 created"
+
+    def test_create_deduplicates_by_fingerprint(self, handlers, store):
+        """Test that an active fingerprint does not open a second incident."""
+        create, _, _, delivery = handlers
+
+        create.handle(CreateIncidentCommand(description="db down", fingerprint="fp"))
+        create.handle(CreateIncidentCommand(description="db down again", fingerprint="fp"))
+
+        assert len(store) == 1
+        assert delivery.submit.call_count == 1
+
+    def test_update_by_fingerprint(self, handlers, store):
+        """Test that updates find incidents through the fingerprint index."""
+        create, update, _, _ = handlers
+        create.handle(CreateIncidentCommand(description="db down", incident_id="i-1", fingerprint="fp"))
+
+        update.handle(UpdateIncidentCommand(fingerprint="fp", status="acknowledged", severity="SEV1"))
+
+        incident = store.get("i-1")
+        assert incident.status == IncidentStatus.ACKNOWLEDGED
+        assert incident.severity == "SEV1"
+
+    def test_resolve_notifies_once(self, handlers, store):
+        """Test that resolving twice only notifies once."""
+        create, _, resolve, delivery = handlers
+        create.handle(CreateIncidentCommand(description="db down", incident_id="i-1"))
+
+        resolve.handle(ResolveIncidentCommand(incident_id="i-1"))
+        resolve.handle(ResolveIncidentCommand(incident_id="i-1"))
+
+        assert store.get("i-1").status == IncidentStatus.RESOLVED
+        assert delivery.submit.call_count == 2
+
+    def test_concurrent_resolves_notify_once(self, handlers, store):
+        """Test that racing resolves of one fingerprint send one notification."""
+        create, _, resolve, delivery = handlers
+        create.handle(CreateIncidentCommand(description="db down", fingerprint="fp"))
+        start = threading.Barrier(8)
+
+        def fire():
+            start.wait()
+            resolve.handle(ResolveIncidentCommand(fingerprint="fp"))
+
+        threads = [threading.Thread(target=fire) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert delivery.submit.call_count == 2
+
+    def test_unknown_incident_is_ignored(self, handlers):
+        """Test that update and resolve skip unknown incidents."""
+        _, update, resolve, delivery = handlers
+
+        update.handle(UpdateIncidentCommand(incident_id="missing", description="x"))
+        resolve.handle(ResolveIncidentCommand(incident_id="missing"))
+
+        delivery.submit.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "command_class, payload, match",
+        [
+            (UpdateIncidentCommand, {}, "id or fingerprint is required"),
+            (UpdateIncidentCommand, {"incident_id": "i", "status": "closed"}, "Unknown incident status"),
+            (ResolveIncidentCommand, {}, "id or fingerprint is required"),
+        ],
+    )
+    def test_command_validation(self, command_class, payload, match):
+        """Test the lifecycle command validation rules."""
+        with pytest.raises(ValueError, match=match):
+            command_class.decode(payload)
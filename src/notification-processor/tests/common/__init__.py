@@ -0,0 +1 @@
+# Empty file to make tests/common directory a Python package
@@ -0,0 +1,38 @@
+"""
+Unit tests for the LatencyTracker class.
+"""
+
+from common.latency import LatencyTracker
+
+
+class TestLatencyTracker:
+    """Test suite for LatencyTracker class."""
+
+    def test_empty_summary(self):
+        """Test that a tracker without samples only reports the count."""
+        assert LatencyTracker().summary() == {"count": 0}
+
+    def test_percentiles(self):
+        """Test percentile selection over recorded samples."""
+        tracker = LatencyTracker()
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+
+        summary = tracker.summary()
+
+        assert summary["count"] == 100
+        assert summary["p50_ms"] == 51.0
+        assert summary["p99_ms"] == 99.0
+        assert summary["max_ms"] == 100.0
+
+    def test_window_keeps_recent_samples(self):
+        """Test that old samples leave the window but still count."""
+        tracker = LatencyTracker(window=2)
+        tracker.record(10.0)
+        tracker.record(0.001)
+        tracker.record(0.002)
+
+        summary = tracker.summary()
+
+        assert summary["count"] == 3
+        assert summary["max_ms"] == 2.0
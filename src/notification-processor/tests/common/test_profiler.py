@@ -0,0 +1,172 @@
+"""
+Unit tests for the MessageProfiler class.
+"""
+
+import threading
+import tracemalloc
+import pytest
+from unittest.mock import Mock
+from common.profiler import MessageProfiler
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """Create a config manager stub with profiling settings."""
+    config = Mock()
+    config.profile_sample_rate = 0.0
+    config.profile_signal_sample_rate = 1.0
+    config.profile_window_seconds = 60
+    config.profile_report_dir = str(tmp_path)
+    config.profile_allocations = True
+    return config
+
+
+@pytest.fixture
+def profiler(config_manager):
+    """Create a MessageProfiler instance for testing."""
+    logger_manager = Mock()
+    logger_manager.get_logger.return_value = Mock()
+    instance = MessageProfiler(config_manager, logger_manager)
+    yield instance
+    instance.stop()
+
+
+def work():
+    """Allocate and compute something worth profiling."""
+    return [str(i) * 4 for i in range(2000)]
+
+
+class TestMessageProfiler:
+    """Test suite for MessageProfiler class."""
+
+    def test_disabled_by_default(self, profiler):
+        """Test that no message is sampled until a window is opened."""
+        profiler.start()
+
+        assert not profiler.should_sample()
+        assert profiler._timer is None
+
+    def test_start_window_enables_sampling(self, profiler):
+        """Test that opening a window enables sampling at the signal rate."""
+        profiler.start_window()
+
+        assert profiler.should_sample()
+
+    def test_configured_rate_starts_continuous_window(self, config_manager):
+        """Test that a configured sampling rate opens a window at startup."""
+        config_manager.profile_sample_rate = 1.0
+        profiler = MessageProfiler(config_manager, Mock())
+
+        profiler.start()
+        try:
+            assert profiler.should_sample()
+        finally:
+            profiler.stop()
+
+    def test_profile_aggregates_samples(self, profiler):
+        """Test that profiled messages are merged into the window stats."""
+        profiler.start_window()
+
+        for _ in range(3):
+            with profiler.profile():
+                work()
+
+        assert profiler._samples == 3
+        assert profiler._stats
+        assert profiler._alloc_bytes
+
+    def test_stop_writes_report(self, profiler, tmp_path):
+        """Test that closing the window writes a report file."""
+        profiler.start_window()
+        with profiler.profile():
+            work()
+
+        profiler.stop()
+
+        reports = list(tmp_path.glob("profile-*.txt"))
+        assert len(reports) == 1
+        content = reports[0].read_text()
+        assert "Sampled messages: 1" in content
+        assert "allocation sites" in content
+        assert not profiler.should_sample()
+
+    def test_profile_ignores_other_threads(self, profiler):
+        """Test that only the sampled thread's calls are recorded."""
+        def other_thread_work():
+            """Run on a concurrent, unsampled worker."""
+            for _ in range(200):
+                work()
+
+        profiler.start_window()
+        with profiler.profile():
+            thread = threading.Thread(target=other_thread_work)
+            thread.start()
+            thread.join()
+            work()
+
+        names = {name for _, _, name in profiler._stats}
+        assert "work" in names
+        assert "other_thread_work" not in names
+
+    def test_report_labels_allocations_process_wide(self, profiler, tmp_path):
+        """Test that the report does not present allocations as per-thread."""
+        profiler.start_window()
+        with profiler.profile():
+            work()
+
+        profiler.stop()
+
+        content = next(tmp_path.glob("profile-*.txt")).read_text()
+        assert "process-wide" in content
+
+    def test_allocation_tracing_can_be_disabled(self, config_manager, tmp_path):
+        """Test that CPU-only profiling leaves tracemalloc off."""
+        config_manager.profile_allocations = False
+        profiler = MessageProfiler(config_manager, Mock())
+        profiler.start_window()
+        with profiler.profile():
+            assert not tracemalloc.is_tracing()
+            work()
+
+        profiler.stop()
+
+        assert profiler._alloc_bytes == {}
+        content = next(tmp_path.glob("profile-*.txt")).read_text()
+        assert "Allocation tracing disabled" in content
+
+    def test_report_write_error_is_logged(self, config_manager, tmp_path):
+        """Test that an unwritable report directory does not raise."""
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        config_manager.profile_report_dir = str(blocker / "reports")
+        config_manager.profile_sample_rate = 1.0
+        logger_manager = Mock()
+        profiler = MessageProfiler(config_manager, logger_manager)
+        profiler.start_window()
+        with profiler.profile():
+            work()
+
+        profiler._end_window()
+        try:
+            logger_manager.get_logger.return_value.error.assert_called_once()
+            # Continuous sampling reopened the window despite the failure
+            assert profiler.should_sample()
+        finally:
+            profiler.stop()
+
+    def test_stop_without_samples_writes_nothing(self, profiler, tmp_path):
+        """Test that an empty window does not produce a report."""
+        profiler.start_window()
+        profiler.stop()
+
+        assert not list(tmp_path.glob("profile-*.txt"))
+
+    def test_profile_exception_propagates_and_is_recorded(self, profiler):
+        """Test that errors inside a profiled block still propagate."""
+        profiler.start_window()
+
+        with pytest.raises(RuntimeError):
+            with profiler.profile():
+                raise RuntimeError("boom")
+
+        assert profiler._samples == 1
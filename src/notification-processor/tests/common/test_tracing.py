@@ -0,0 +1,104 @@
+"""
+Unit tests for message tracing.
+"""
+
+import json
+import structlog
+import pytest
+from unittest.mock import Mock
+from common.tracing import FileSpanExporter, Tracer, activate, current_trace, stage
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    """Create a Tracer that samples every message."""
+    config_manager = Mock()
+    config_manager.trace_sample_rate = 1.0
+    config_manager.trace_export_path = str(tmp_path / "spans.jsonl")
+    return Tracer(config_manager, Mock())
+
+
+def read_spans(path):
+    """Read exported spans."""
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestTracing:
+    """Test suite for traces, stages and span export."""
+
+    def test_propagated_trace_id_is_kept(self, tracer):
+        """Test that a trace id from the publisher is reused."""
+        assert tracer.start_trace("m-1", "abc").trace_id == "abc"
+        assert len(tracer.start_trace("m-1").trace_id) == 32
+
+    def test_activate_binds_trace_into_context_and_logs(self, tracer):
+        """Test that the active trace is visible to code and structlog."""
+        trace = tracer.start_trace("m-1", "abc")
+
+        with activate(trace):
+            assert current_trace() is trace
+            assert structlog.contextvars.get_contextvars()["trace_id"] == "abc"
+
+        assert current_trace() is None
+        assert "trace_id" not in structlog.contextvars.get_contextvars()
+
+    def test_stages_recorded_and_exported(self, tracer):
+        """Test that sampled stages end up in the span file."""
+        trace = tracer.start_trace("m-1", "abc")
+        trace.attributes["lane"] = "critical"
+        with activate(trace):
+            with stage("decode"):
+                pass
+            with pytest.raises(RuntimeError):
+                with stage("dispatch"):
+                    raise RuntimeError("boom")
+
+        tracer.finish(trace, "ack")
+        tracer.close()
+
+        span, = read_spans(tracer.exporter.path)
+        assert span["trace_id"] == "abc"
+        assert span["lane"] == "critical"
+        assert span["outcome"] == "ack"
+        assert [s["name"] for s in span["stages"]] == ["decode", "dispatch"]
+        assert span["duration_ms"] >= span["stages"][-1]["offset_ms"]
+
+    def test_unsampled_trace_records_nothing(self, tracer):
+        """Test that unsampled traces skip timing and export."""
+        tracer.sample_rate = 0
+        trace = tracer.start_trace("m-1")
+        with activate(trace):
+            with stage("decode"):
+                pass
+
+        tracer.finish(trace, "ack")
+        tracer.close()
+
+        assert trace.stages == []
+        assert tracer.exporter.exported == 0
+
+    def test_stage_without_trace_is_noop(self):
+        """Test that stages outside message processing are ignored."""
+        with stage("decode"):
+            assert current_trace() is None
+
+    def test_stage_cap(self, tracer):
+        """Test that oversized traces count dropped stages."""
+        trace = tracer.start_trace("m-1")
+        for _ in range(trace.max_stages + 3):
+            trace.record("handle", 0.0, 0.0)
+
+        assert len(trace.stages) == trace.max_stages
+        assert trace.dropped_stages == 3
+
+    def test_exporter_writes_in_batches(self, tmp_path):
+        """Test that spans are buffered until the batch is full."""
+        exporter = FileSpanExporter(str(tmp_path / "out" / "spans.jsonl"), batch_size=2)
+
+        exporter.export({"n": 1})
+        assert exporter.exported == 0
+        exporter.export({"n": 2})
+
+        assert exporter.exported == 2
+        assert read_spans(exporter.path) == [{"n": 1}, {"n": 2}]
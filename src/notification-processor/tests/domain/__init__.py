@@ -0,0 +1 @@
+# Empty file to make tests/domain directory a Python package
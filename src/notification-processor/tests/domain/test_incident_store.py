@@ -0,0 +1,253 @@
+"""
+Unit tests for the IncidentStore class.
+"""
+
+import json
+import threading
+import pytest
+from domain.incident import Incident, IncidentStatus
+from domain.incident_store import (IncidentNotFoundError, IncidentStore,
+    IncidentStoreFullError)
+
+
+def make_incident(incident_id, **fields):
+    """Create an incident with a default description."""
+    return Incident(incident_id=incident_id, description=f"incident {incident_id}", **fields)
+
+
+@pytest.fixture
+def store():
+    """Create an IncidentStore instance for testing."""
+    return IncidentStore(max_incidents=4)
+
+
+class TestIncidentStore:
+    """Test suite for IncidentStore class."""
+
+    def test_add_and_lookup_by_indexes(self, store):
+        """Test lookups by id, fingerprint, service and status."""
+        store.add(make_incident("a", fingerprint="fp-a", service="checkout"))
+        store.add(make_incident("b", service="checkout", status=IncidentStatus.ACKNOWLEDGED))
+
+        assert store.get("a").description == "incident a"
+        assert store.find_by_fingerprint("fp-a").incident_id == "a"
+        assert {i.incident_id for i in store.by_service("checkout")} == {"a", "b"}
+        assert [i.incident_id for i in store.by_service("checkout", IncidentStatus.OPEN)] == ["a"]
+        assert store.count(IncidentStatus.ACKNOWLEDGED) == 1
+        assert len(store) == 2
+
+    def test_find_prefers_id_then_fingerprint(self, store):
+        """Test that find falls back to the fingerprint index."""
+        store.add(make_incident("a", fingerprint="fp-a"))
+
+        assert store.find("missing", "fp-a").incident_id == "a"
+        assert store.find(None, None) is None
+
+    def test_add_duplicate_id_raises_value_error(self, store):
+        """Test that ids are unique."""
+        store.add(make_incident("a"))
+
+        with pytest.raises(ValueError, match="already exists"):
+            store.add(make_incident("a"))
+
+    def test_add_active_duplicate_fingerprint_raises_value_error(self, store):
+        """Test that add does not overwrite the active fingerprint index."""
+        store.add(make_incident("a", fingerprint="fp"))
+
+        with pytest.raises(ValueError, match="already has an active incident"):
+            store.add(make_incident("b", fingerprint="fp"))
+        assert store.find_by_fingerprint("fp").incident_id == "a"
+
+    def test_add_or_get_returns_existing_duplicate(self, store):
+        """Test that duplicates by id or fingerprint are refreshed, not added."""
+        store.add(make_incident("a", fingerprint="fp", updated_at=1.0))
+
+        by_fingerprint, created = store.add_or_get(make_incident("b", fingerprint="fp"), now=5.0)
+        by_id, created_again = store.add_or_get(make_incident("a"), now=6.0)
+
+        assert (by_fingerprint.incident_id, created) == ("a", False)
+        assert (by_id.incident_id, created_again) == ("a", False)
+        assert by_id.updated_at == 6.0
+        assert len(store) == 1
+
+    def test_add_or_get_is_atomic_across_threads(self):
+        """Test that concurrent re-fires of a fingerprint create one incident."""
+        store = IncidentStore(max_incidents=64)
+        start = threading.Barrier(16)
+        created = []
+
+        def fire(index):
+            start.wait()
+            created.append(store.add_or_get(make_incident(f"i-{index}", fingerprint="fp"))[1])
+
+        threads = [threading.Thread(target=fire, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert created.count(True) == 1
+        assert len(store) == 1
+
+    def test_update_moves_status_bitsets(self, store):
+        """Test that status changes keep the status index consistent."""
+        store.add(make_incident("a"))
+
+        store.update("a", status=IncidentStatus.ACKNOWLEDGED, severity="SEV2", now=10.0)
+
+        incident = store.get("a")
+        assert incident.severity == "SEV2"
+        assert incident.updated_at == 10.0
+        assert store.count(IncidentStatus.OPEN) == 0
+        assert [i.incident_id for i in store.by_status(IncidentStatus.ACKNOWLEDGED)] == ["a"]
+
+    def test_update_unknown_raises_not_found(self, store):
+        """Test that updating an unknown incident raises."""
+        with pytest.raises(IncidentNotFoundError):
+            store.update("missing", description="x")
+
+    def test_resolve_releases_fingerprint(self, store):
+        """Test that a resolved incident no longer matches its fingerprint."""
+        store.add(make_incident("a", fingerprint="fp"))
+
+        store.resolve("a", now=5.0)
+
+        assert store.get("a").resolved_at == 5.0
+        assert store.find_by_fingerprint("fp") is None
+        assert store.count(IncidentStatus.RESOLVED) == 1
+
+    def test_reopen_restores_fingerprint(self, store):
+        """Test that reopening a resolved incident makes it active again."""
+        store.add(make_incident("a", fingerprint="fp"))
+        store.resolve("a")
+
+        store.update("a", status=IncidentStatus.OPEN)
+
+        assert store.find_by_fingerprint("fp").incident_id == "a"
+        assert store.get("a").resolved_at is None
+
+    def test_reopen_rejected_when_fingerprint_taken(self, store):
+        """Test that reopening cannot create a second active fingerprint."""
+        store.add(make_incident("a", fingerprint="fp"))
+        store.resolve("a")
+        store.add(make_incident("b", fingerprint="fp"))
+
+        with pytest.raises(ValueError, match="held by b"):
+            store.update("a", status=IncidentStatus.OPEN)
+        assert store.get("a").status == IncidentStatus.RESOLVED
+        assert store.find_by_fingerprint("fp").incident_id == "b"
+
+    def test_failed_load_keeps_current_contents(self, store, tmp_path):
+        """Test that a conflicting snapshot never leaves a partial store."""
+        path = tmp_path / "snapshot.jsonl"
+        records = [make_incident(i, fingerprint="fp").to_dict() for i in ("x", "y")]
+        path.write_text(
+            '{"version": 1}\n' + "".join(json.dumps(r) + "\n" for r in records)
+        )
+        store.add(make_incident("a"))
+
+        with pytest.raises(ValueError, match="already has an active incident"):
+            store.load(str(path))
+
+        assert len(store) == 1
+        assert store.get("a") is not None
+        assert store.get("x") is None
+
+    def test_resolve_active_changes_once(self, store):
+        """Test that only the first resolve reports a change."""
+        store.add(make_incident("a", fingerprint="fp"))
+
+        first = store.resolve_active(fingerprint="fp", now=1.0)
+        by_id = store.resolve_active("a", now=2.0)
+        unknown = store.resolve_active("missing", "other")
+
+        assert (first[0].incident_id, first[1]) == ("a", True)
+        assert by_id[1] is False
+        assert by_id[0].resolved_at == 1.0
+        assert unknown == (None, False)
+
+    def test_returned_incidents_are_copies(self, store):
+        """Test that callers cannot change stored incidents or indexes."""
+        added = store.add(make_incident("a", fingerprint="fp"))
+        added.fingerprint = "other"
+        store.get("a").status = IncidentStatus.RESOLVED
+
+        assert store.get("a").status == IncidentStatus.OPEN
+        assert store.find_by_fingerprint("fp").incident_id == "a"
+
+    def test_full_store_evicts_oldest_resolved(self, store):
+        """Test that capacity is reclaimed from the oldest resolved incident."""
+        for incident_id in "abcd":
+            store.add(make_incident(incident_id, service="svc"))
+        store.resolve("b", now=1.0)
+        store.resolve("c", now=2.0)
+
+        store.add(make_incident("e", service="svc"))
+
+        assert store.get("b") is None
+        assert store.get("c") is not None
+        assert store.evicted == 1
+        assert len(store) == 4
+        assert "b" not in {i.incident_id for i in store.by_service("svc")}
+
+    def test_reopened_incident_is_not_evicted(self, store):
+        """Test that stale eviction entries are skipped."""
+        for incident_id in "abcd":
+            store.add(make_incident(incident_id))
+        store.resolve("a", now=1.0)
+        store.update("a", status=IncidentStatus.OPEN)
+        store.resolve("b", now=2.0)
+
+        store.add(make_incident("e"))
+
+        assert store.get("a") is not None
+        assert store.get("b") is None
+
+    def test_flapping_incident_keeps_eviction_queue_bounded(self, store):
+        """Test that repeated reopen/resolve cycles do not grow memory."""
+        store.add(make_incident("a"))
+        store.add(make_incident("b"))
+        for cycle in range(1000):
+            store.resolve("a", now=float(cycle))
+            store.update("a", status=IncidentStatus.OPEN)
+        store.resolve("a", now=5000.0)
+        store.resolve("b", now=6000.0)
+
+        assert len(store._resolved) <= 2 * store.max_incidents
+        # The latest resolution still drives eviction order
+        for index in range(3):
+            store.add(make_incident(f"n{index}"))
+        assert store.get("a") is None
+        assert store.get("b") is not None
+
+    def test_full_store_without_resolved_raises(self, store):
+        """Test that unresolved incidents are never evicted."""
+        for incident_id in "abcd":
+            store.add(make_incident(incident_id))
+
+        with pytest.raises(IncidentStoreFullError):
+            store.add(make_incident("e"))
+
+    def test_snapshot_round_trip(self, store, tmp_path):
+        """Test that a snapshot rebuilds every index."""
+        store.add(make_incident("a", fingerprint="fp", service="svc", severity="SEV1"))
+        store.add(make_incident("b", service="svc"))
+        store.resolve("b", now=3.0)
+        path = str(tmp_path / "snapshots" / "incidents.jsonl")
+
+        assert store.save(path) == 2
+        restored = IncidentStore(max_incidents=4)
+        assert restored.load(path) == 2
+
+        assert restored.get("a") == store.get("a")
+        assert restored.find_by_fingerprint("fp").incident_id == "a"
+        assert restored.count(IncidentStatus.RESOLVED) == 1
+        assert len(restored.by_service("svc")) == 2
+
+    def test_load_rejects_unknown_version(self, store, tmp_path):
+        """Test that snapshots from another format version are rejected."""
+        path = tmp_path / "incidents.jsonl"
+        path.write_text('{"version": 99}\n')
+
+        with pytest.raises(ValueError, match="Unsupported snapshot version"):
+            store.load(str(path))
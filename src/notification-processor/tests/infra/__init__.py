@@ -0,0 +1 @@
+# Empty file to make tests/infra directory a Python package
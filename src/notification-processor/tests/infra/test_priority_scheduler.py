@@ -0,0 +1,168 @@
+"""
+Unit tests for the PriorityScheduler class.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+from infra.priority_scheduler import Lane, PriorityScheduler
+
+
+@pytest.fixture
+def mock_logger_manager():
+    """Create a mock logger manager."""
+    logger_manager = Mock()
+    logger_manager.get_logger.return_value = Mock()
+    return logger_manager
+
+
+def drain_order(scheduler, count):
+    """Pick work items without running them, freeing each slot immediately."""
+    order = []
+    for _ in range(count):
+        lane, work, shared = scheduler._pick()
+        order.append(lane.name)
+        lane.running -= 1
+        if shared:
+            lane.shared_running -= 1
+            scheduler._shared_running -= 1
+    return order
+
+
+class TestPriorityScheduler:
+    """Test suite for PriorityScheduler class."""
+
+    @pytest.mark.parametrize(
+        "severity, lane",
+        [("SEV1", "critical"), ("sev2", "high"), (" P3 ", "normal"),
+         ("low", "low"), (None, "normal"), ("bogus", "normal")],
+    )
+    def test_lane_for(self, mock_logger_manager, severity, lane):
+        """Test that severities map to lanes, defaulting to normal."""
+        scheduler = PriorityScheduler(mock_logger_manager)
+
+        assert scheduler.lane_for(severity) == lane
+
+    def test_reservations_must_leave_shared_workers(self, mock_logger_manager):
+        """Test that reserving every worker is rejected."""
+        with pytest.raises(ValueError, match="more than 3 workers"):
+            PriorityScheduler(mock_logger_manager, workers=3)
+
+    def test_weighted_fairness(self, mock_logger_manager):
+        """Test that lanes are served in proportion to their weights."""
+        scheduler = PriorityScheduler(
+            mock_logger_manager,
+            workers=1,
+            lanes=[Lane("critical", weight=3), Lane("low", weight=1)],
+        )
+        for _ in range(40):
+            scheduler.submit("critical", lambda: None)
+            scheduler.submit("low", lambda: None)
+
+        order = drain_order(scheduler, 40)
+
+        assert order.count("critical") == 30
+        assert order.count("low") == 10
+        # Low-priority work is interleaved, not starved until the end
+        assert "low" in order[:5]
+
+    def test_idle_lane_does_not_bank_credit(self, mock_logger_manager):
+        """Test that a lane returning from idle does not monopolize workers."""
+        scheduler = PriorityScheduler(
+            mock_logger_manager,
+            workers=1,
+            lanes=[Lane("critical", weight=1), Lane("low", weight=1)],
+        )
+        for _ in range(10):
+            scheduler.submit("low", lambda: None)
+        drain_order(scheduler, 6)
+        for _ in range(4):
+            scheduler.submit("critical", lambda: None)
+
+        order = drain_order(scheduler, 4)
+
+        # Without the catch-up to virtual time critical would take all four
+        assert "low" in order
+
+    def test_reserved_worker_serves_critical_while_saturated(self, mock_logger_manager):
+        """Test that critical work runs while shared workers are blocked."""
+        scheduler = PriorityScheduler(
+            mock_logger_manager,
+            workers=2,
+            lanes=[Lane("critical", weight=1, reserved=1), Lane("low", weight=1)],
+        )
+        release = threading.Event()
+        critical_done = threading.Event()
+        scheduler.start()
+        try:
+            for _ in range(5):
+                scheduler.submit("low", release.wait)
+            scheduler.submit("critical", critical_done.set)
+
+            assert critical_done.wait(timeout=2)
+            assert scheduler.snapshot()["low"]["queued"] == 4
+        finally:
+            release.set()
+            scheduler.shutdown()
+
+    def test_freed_reserved_worker_is_reused_while_shared_busy(self, mock_logger_manager):
+        """Test that shared-slot work does not hold a lane's reserved workers."""
+        scheduler = PriorityScheduler(
+            mock_logger_manager,
+            workers=3,
+            lanes=[Lane("critical", weight=1, reserved=2)],
+        )
+        for _ in range(3):
+            scheduler.submit("critical", lambda: None)
+        picks = [scheduler._pick() for _ in range(3)]
+        assert [shared for _, _, shared in picks] == [False, False, True]
+
+        # A finishes and frees one reserved worker; C still holds the shared one
+        lane = picks[0][0]
+        lane.running -= 1
+        scheduler.submit("critical", lambda: None)
+
+        picked = scheduler._pick()
+        assert picked is not None
+        assert picked[2] is False
+
+    def test_snapshot_reports_queueing_delay(self, mock_logger_manager):
+        """Test that per-lane dispatch counts and waits are recorded."""
+        scheduler = PriorityScheduler(mock_logger_manager, workers=4)
+        done = threading.Event()
+        scheduler.submit("high", done.set)
+        scheduler.start()
+        try:
+            assert done.wait(timeout=2)
+        finally:
+            scheduler.shutdown()
+
+        stats = scheduler.snapshot()["high"]
+        assert stats["dispatched"] == 1
+        assert stats["max_wait_ms"] >= stats["mean_wait_ms"] > 0
+
+    def test_shutdown_cancel_pending_drops_queued_work(self, mock_logger_manager):
+        """Test that cancelling on shutdown discards queued work."""
+        scheduler = PriorityScheduler(mock_logger_manager, workers=4)
+        work = Mock()
+        scheduler.submit("low", work)
+        scheduler.submit("normal", work)
+
+        assert scheduler.shutdown(cancel_pending=True) == 2
+        work.assert_not_called()
+        with pytest.raises(RuntimeError, match="shutting down"):
+            scheduler.submit("low", work)
+
+    def test_work_errors_do_not_kill_workers(self, mock_logger_manager):
+        """Test that an exception in work is logged and the worker continues."""
+        scheduler = PriorityScheduler(mock_logger_manager, workers=4)
+        done = threading.Event()
+        scheduler.start()
+        try:
+            scheduler.submit("normal", Mock(side_effect=RuntimeError("boom")))
+            scheduler.submit("normal", done.set)
+            assert done.wait(timeout=2)
+        finally:
+            scheduler.shutdown()
+
+        mock_logger_manager.get_logger.return_value.error.assert_called_once()
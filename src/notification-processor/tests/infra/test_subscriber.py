@@ -0,0 +1,255 @@
+"""
+Unit tests for the Subscriber drain protocol and priority classification.
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+import pytest
+import structlog
+from unittest.mock import MagicMock, Mock, patch
+from application.commands.factory import CommandFactory
+from common.tracing import Tracer
+from infra.priority_scheduler import PriorityScheduler
+from infra.subscriber import Subscriber
+
+
+def make_message(message_id: str):
+    """Create a mock Pub/Sub message."""
+    message = Mock()
+    message.message_id = message_id
+    return message
+
+
+@pytest.fixture
+def subscriber():
+    """Create a Subscriber with a mocked Pub/Sub client and container."""
+    container = Mock()
+    container.logger_manager.return_value.get_logger.return_value = Mock()
+    with patch("infra.subscriber.SubscriberClient"):
+        instance = Subscriber(
+            project_id="local-project",
+            subscription_id="my-sub",
+            container=container,
+            max_messages=10,
+        )
+    instance._subscriber_future = Mock()
+    return instance
+
+
+class TestSubscriberDrain:
+    """Test suite for Subscriber.drain."""
+
+    def test_drain_with_no_inflight_messages(self, subscriber):
+        """Test that an idle subscriber drains immediately."""
+        stats = asyncio.run(subscriber.drain(timeout=1))
+
+        assert stats.completed == 0
+        assert stats.nacked == 0
+        subscriber._subscriber_future.cancel.assert_called_once()
+
+    def test_drain_rejects_new_messages(self, subscriber):
+        """Test that messages arriving after the drain ended are nacked."""
+        asyncio.run(subscriber.drain(timeout=1))
+        message = make_message("late")
+
+        assert subscriber._track(message) is False
+        assert subscriber._drain_stats.rejected == 1
+        message.nack.assert_called_once()
+
+    def test_drain_holds_rejected_messages_until_done(self, subscriber):
+        """Test that a message refused mid-drain is nacked only at the end."""
+        inflight = make_message("1")
+        late = make_message("late")
+        assert subscriber._track(inflight)
+        nacked_during_drain = []
+
+        def arrive_then_finish():
+            assert subscriber._track(late) is False
+            nacked_during_drain.append(late.nack.called)
+            subscriber._release(inflight)
+
+        timer = threading.Timer(0.05, arrive_then_finish)
+        timer.start()
+        stats = asyncio.run(subscriber.drain(timeout=5))
+        timer.join()
+
+        assert nacked_during_drain == [False]
+        late.nack.assert_called_once()
+        inflight.nack.assert_not_called()
+        assert stats.completed == 1
+        assert stats.nacked == 0
+        assert stats.rejected == 1
+
+    def test_drain_waits_for_inflight_messages(self, subscriber):
+        """Test that in-flight messages finishing before the deadline are kept."""
+        message = make_message("1")
+        assert subscriber._track(message)
+
+        timer = threading.Timer(0.05, subscriber._release, args=(message,))
+        timer.start()
+        stats = asyncio.run(subscriber.drain(timeout=5))
+        timer.join()
+
+        assert stats.completed == 1
+        assert stats.nacked == 0
+        message.nack.assert_not_called()
+
+    def test_drain_nacks_messages_past_deadline(self, subscriber):
+        """Test that messages still running at the deadline are nacked."""
+        message = make_message("1")
+        subscriber._track(message)
+
+        stats = asyncio.run(subscriber.drain(timeout=0.01))
+
+        assert stats.completed == 0
+        assert stats.nacked == 1
+        message.nack.assert_called_once()
+        # The callback no longer owns the message once the drain nacked it
+        assert subscriber._release(message) is False
+
+
+class TestSubscriberClassify:
+    """Test suite for Subscriber priority lane classification."""
+
+    @pytest.fixture(autouse=True)
+    def real_scheduler(self, subscriber):
+        """Use the real scheduler lane mapping."""
+        subscriber.scheduler = PriorityScheduler(Mock())
+
+    def test_message_uses_severity_attribute(self, subscriber):
+        """Test that messages are laned by attribute without being decoded."""
+        message = make_message("1")
+        message.data = b"database down"
+        message.attributes = {"severity": "SEV1"}
+
+        assert subscriber._classify(message) == "critical"
+        subscriber.container.command_factory.assert_not_called()
+
+    def test_batch_uses_severity_attribute(self, subscriber):
+        """Test that batches are laned by attribute without being expanded."""
+        message = make_message("1")
+        message.data = b'"a"\n"b"\n'
+        message.attributes = {"content-type": "application/x-ndjson", "severity": "low"}
+
+        assert subscriber._classify(message) == "low"
+
+    def test_missing_severity_goes_to_default_lane(self, subscriber):
+        """Test that messages without a severity use the default lane."""
+        message = make_message("1")
+        message.attributes = {}
+
+        assert subscriber._classify(message) == "normal"
+
+    def test_decode_runs_inside_profiled_path(self, subscriber):
+        """Test that the factory stage is covered by the profiler hook."""
+        subscriber.container.command_factory.return_value = CommandFactory()
+        subscriber.profiler.should_sample.return_value = True
+        profiling = []
+        subscriber.profiler.profile.return_value = MagicMock(
+            __enter__=lambda _: profiling.append(True),
+            __exit__=lambda *_: profiling.append(False),
+        )
+        decoded_while_profiling = []
+        dispatcher = subscriber.container.command_dispatcher.return_value
+        dispatcher.dispatch.side_effect = lambda command: decoded_while_profiling.append(
+            profiling[-1]
+        )
+        message = make_message("1")
+        message.data = b"disk full"
+        message.attributes = {}
+
+        assert asyncio.run(subscriber.async_process_message(message))
+        assert decoded_while_profiling == [True]
+
+
+class TestSubscriberLatency:
+    """Test suite for Subscriber end-to-end latency recording."""
+
+    def test_stamped_message_is_recorded(self, subscriber):
+        """Test that the publish-time attribute yields a latency sample."""
+        message = make_message("1")
+        message.attributes = {"publish-time-ns": str(time.time_ns() - 5_000_000)}
+
+        subscriber._record_e2e_latency(message)
+
+        assert subscriber.e2e_latency.summary()["p50_ms"] >= 5
+
+    @pytest.mark.parametrize("attributes", [{}, {"publish-time-ns": "soon"}])
+    def test_unstamped_message_is_ignored(self, subscriber, attributes):
+        """Test that missing or malformed stamps are skipped."""
+        message = make_message("1")
+        message.attributes = attributes
+
+        subscriber._record_e2e_latency(message)
+
+        assert subscriber.e2e_latency.count == 0
+
+
+class TestSubscriberTracing:
+    """Test suite for per-message tracing in the Subscriber."""
+
+    def test_trace_follows_message_to_span(self, subscriber, tmp_path):
+        """Test that one span covers queueing, decoding, dispatch and ack."""
+        config_manager = Mock()
+        config_manager.trace_sample_rate = 1.0
+        config_manager.trace_export_path = str(tmp_path / "spans.jsonl")
+        subscriber.tracer = Tracer(config_manager, Mock())
+        subscriber.profiler.should_sample.return_value = False
+        subscriber.container.command_factory.return_value = CommandFactory()
+        dispatcher = subscriber.container.command_dispatcher.return_value
+        seen = []
+        dispatcher.dispatch.side_effect = lambda command: seen.append(
+            structlog.contextvars.get_contextvars().get("trace_id")
+        )
+        message = make_message("1")
+        message.data = b"disk full"
+        message.attributes = {"trace-id": "abc"}
+        trace = subscriber.tracer.start_trace("1", "abc")
+        subscriber._track(message)
+
+        subscriber._process_scheduled(message, trace, time.monotonic())
+        subscriber.tracer.close()
+
+        with open(config_manager.trace_export_path) as f:
+            span = json.loads(f.readline())
+        assert seen == ["abc"]
+        assert span["outcome"] == "ack"
+        assert [s["name"] for s in span["stages"]] == ["queued", "decode", "process", "ack"]
+        message.ack.assert_called_once()
+
+
+class TestSubscriberBatch:
+    """Test suite for batch envelope processing in the Subscriber."""
+
+    def test_truncated_envelope_dispatches_nothing(self, subscriber):
+        """Test that a nacked envelope has no already-dispatched items."""
+        subscriber.container.command_factory.return_value = CommandFactory()
+        subscriber.profiler.should_sample.return_value = False
+        body = b"".join(b'"item %d"\n' % i for i in range(20000))
+        compressed = gzip.compress(body)
+        message = make_message("1")
+        message.data = compressed[: len(compressed) // 2]
+        message.attributes = {"content-encoding": "gzip", "content-type": "application/x-ndjson"}
+
+        assert asyncio.run(subscriber.async_process_message(message)) is False
+        subscriber.container.command_dispatcher.return_value.dispatch.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "error, processed",
+        [(ValueError("invalid item"), True), (RuntimeError("store down"), False)],
+    )
+    def test_only_invalid_items_are_skipped(self, subscriber, error, processed):
+        """Test that only validation errors are skipped; other failures nack."""
+        subscriber.container.command_factory.return_value = CommandFactory()
+        subscriber.profiler.should_sample.return_value = False
+        dispatch = subscriber.container.command_dispatcher.return_value.dispatch
+        dispatch.side_effect = [error, None]
+        message = make_message("1")
+        message.data = b'"a"\n"b"\n'
+        message.attributes = {"content-type": "application/x-ndjson"}
+
+        assert asyncio.run(subscriber.async_process_message(message)) is processed
+        assert dispatch.call_count == (2 if processed else 1)
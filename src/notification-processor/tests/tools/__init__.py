@@ -0,0 +1 @@
+# Empty file to make tests/tools directory a Python package
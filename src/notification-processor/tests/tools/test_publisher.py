@@ -0,0 +1,142 @@
+"""
+Unit tests for the load generator publisher tool.
+"""
+
+import gzip
+import json
+from concurrent.futures import Future
+from unittest.mock import Mock
+import pytest
+from application.commands.factory import CommandFactory
+from tools.publisher import IncidentGenerator, LoadPublisher, parse_arguments
+
+
+def make_publisher(client, **kwargs):
+    """Create a LoadPublisher around a mocked client."""
+    client.topic_path.return_value = "projects/p/topics/t"
+    return LoadPublisher(
+        project_id="p",
+        topic_id="t",
+        logger=Mock(),
+        generator=IncidentGenerator(seed=1),
+        batch_settings=None,
+        client=client,
+        **kwargs,
+    )
+
+
+def resolved_future(exception=None):
+    """Create a completed publish future."""
+    future = Future()
+    if exception:
+        future.set_exception(exception)
+    else:
+        future.set_result("message-id")
+    return future
+
+
+def published_message(client, index=0):
+    """Rebuild the Pub/Sub message passed to the mocked client."""
+    args, kwargs = client.publish.call_args_list[index]
+    message = Mock()
+    message.data = args[1]
+    message.attributes = {k: v for k, v in kwargs.items() if k != "ordering_key"}
+    return message, kwargs["ordering_key"]
+
+
+class TestIncidentGenerator:
+    """Test suite for IncidentGenerator class."""
+
+    def test_resolves_only_open_alerts(self):
+        """Test that resolve commands target previously created fingerprints."""
+        generator = IncidentGenerator(resolve_ratio=0.5, seed=7)
+        created = set()
+
+        for _ in range(200):
+            command = generator.next_command()
+            if command["type"] == "CreateIncident":
+                created.add(command["fingerprint"])
+            else:
+                assert command["fingerprint"] in created
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed yields the same stream."""
+        first = [IncidentGenerator(seed=3).next_command() for _ in range(5)]
+        second = [IncidentGenerator(seed=3).next_command() for _ in range(5)]
+
+        assert first == second
+
+
+class TestLoadPublisher:
+    """Test suite for LoadPublisher class."""
+
+    def test_single_message_decodes_with_factory(self):
+        """Test that published messages are accepted by the subscriber's factory."""
+        client = Mock()
+        client.publish.return_value = resolved_future()
+        publisher = make_publisher(client, ordering="service")
+
+        publisher.publish_one()
+
+        message, ordering_key = published_message(client)
+        command = CommandFactory().create(message)
+        assert command.severity == message.attributes["severity"]
+        assert ordering_key
+        assert int(message.attributes["publish-time-ns"]) > 0
+
+    def test_compressed_envelope(self):
+        """Test that envelopes are gzip NDJSON laned by their most severe item."""
+        client = Mock()
+        client.publish.return_value = resolved_future()
+        publisher = make_publisher(client, envelope_size=20, compress=True)
+
+        publisher.publish_one()
+
+        message, _ = published_message(client)
+        lines = gzip.decompress(message.data).decode("utf-8").splitlines()
+        severities = {json.loads(line)["severity"] for line in lines}
+        assert len(lines) == 20
+        assert message.attributes["severity"] == min(severities)
+        assert len(list(CommandFactory().create_batch(message))) == 20
+
+    def test_run_counts_sent_and_failed(self):
+        """Test that a counted run waits for futures and tallies failures."""
+        client = Mock()
+        client.publish.side_effect = [
+            resolved_future(), resolved_future(RuntimeError("unavailable")), resolved_future(),
+        ]
+        publisher = make_publisher(client)
+
+        stats = publisher.run(rate=1000, count=3)
+
+        assert stats["sent"] == 3
+        assert stats["failed"] == 1
+        assert stats["publish_latency"]["count"] == 2
+
+    def test_failed_ordered_publish_resumes_key(self):
+        """Test that a failed ordering key is resumed for later messages."""
+        client = Mock()
+        client.publish.return_value = resolved_future(RuntimeError("unavailable"))
+        publisher = make_publisher(client, ordering="fingerprint")
+
+        publisher.publish_one()
+
+        _, ordering_key = published_message(client)
+        client.resume_publish.assert_called_once_with("projects/p/topics/t", ordering_key)
+
+    def test_burst_run(self):
+        """Test that bursts stop at the requested count."""
+        client = Mock()
+        client.publish.return_value = resolved_future()
+        publisher = make_publisher(client)
+
+        stats = publisher.run(count=7, burst_size=5, burst_interval=0.2)
+
+        assert stats["sent"] == 7
+        # One interval between the two bursts, none after the last one
+        assert stats["elapsed_s"] < 0.4
+
+    def test_arguments_require_a_stop_condition(self):
+        """Test that a run without duration or count is rejected."""
+        with pytest.raises(SystemExit):
+            parse_arguments([])
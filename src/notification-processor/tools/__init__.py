@@ -0,0 +1,3 @@
+"""
+Operational Tools Package
+"""
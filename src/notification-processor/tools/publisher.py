@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Incident Load Generator
+
+Publishes realistic incident messages to the configured Pub/Sub topic at a
+target rate or in bursts. Every message is stamped with its publish time so
+the subscriber can report publish-to-ack latency. Works against the local
+emulator when PUBSUB_EMULATOR_HOST is set.
+
+Usage:
+    python -m tools.publisher --rate 500 --duration 60
+    python -m tools.publisher --burst-size 5000 --burst-interval 10 --count 50000
+"""
+
+import argparse
+import gzip
+import json
+import random
+import threading
+import time
+from typing import Optional
+from google.api_core.exceptions import AlreadyExists
+from google.cloud.pubsub_v1 import PublisherClient
+from google.cloud.pubsub_v1.types import BatchSettings, PublisherOptions
+from application.commands.factory import (
+    COMMAND_TYPE_ATTRIBUTE,
+    CONTENT_ENCODING_ATTRIBUTE,
+    CONTENT_TYPE_ATTRIBUTE,
+    NDJSON_CONTENT_TYPE,
+    PUBLISH_TIME_ATTRIBUTE,
+    SEVERITY_ATTRIBUTE,
+)
+from common.latency import LatencyTracker
+from di.container import Container
+
+SERVICES = (
+    "checkout", "payments", "search", "auth", "inventory",
+    "notifications", "recommendations", "shipping", "catalog", "gateway",
+)
+SYMPTOMS = (
+    "p99 latency above SLO on {service}",
+    "error rate above 5% on {service}",
+    "{service} pods crash-looping",
+    "database connection pool exhausted on {service}",
+    "disk usage above 90% on {service} nodes",
+    "{service} health check failing in {region}",
+    "certificate for {service} expires in 7 days",
+    "queue backlog growing on {service}",
+)
+REGIONS = ("us-east1", "us-central1", "europe-west1", "asia-east1")
+# Severity mix of a typical alert stream: pages are rare, warnings common
+SEVERITIES = (("SEV1", 2), ("SEV2", 8), ("SEV3", 40), ("SEV4", 50))
+SEVERITY_RANK = {"SEV1": 0, "SEV2": 1, "SEV3": 2, "SEV4": 3}
+
+
+class IncidentGenerator:
+    """
+    Produces incident commands resembling a monitoring alert stream.
+
+    Alerts re-fire with the same fingerprint, so deduplication is exercised,
+    and a share of the open alerts is later resolved.
+    """
+
+    def __init__(self, resolve_ratio: float = 0.3, seed: Optional[int] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            resolve_ratio: Probability that a command resolves an open alert
+            seed: Random seed for reproducible runs
+        """
+        self.resolve_ratio = resolve_ratio
+        self._random = random.Random(seed)
+        self._open = []
+        self._severities = [s for s, _ in SEVERITIES]
+        self._weights = [w for _, w in SEVERITIES]
+
+    def next_command(self) -> dict:
+        """
+        Return the next command as a JSON-serializable dictionary.
+
+        Returns:
+            dict: Command fields including its ``type``
+        """
+        if self._open and self._random.random() < self.resolve_ratio:
+            index = self._random.randrange(len(self._open))
+            self._open[index] = self._open[-1]
+            fingerprint, service, severity = self._open.pop()
+            return {
+                "type": "ResolveIncident",
+                "fingerprint": fingerprint,
+                "service": service,
+                "severity": severity,
+            }
+
+        service = self._random.choice(SERVICES)
+        symptom = self._random.choice(SYMPTOMS)
+        region = self._random.choice(REGIONS)
+        severity = self._random.choices(self._severities, self._weights)[0]
+        fingerprint = f"{service}:{SYMPTOMS.index(symptom)}:{region}"
+        self._open.append((fingerprint, service, severity))
+        return {
+            "type": "CreateIncident",
+            "description": symptom.format(service=service, region=region),
+            "severity": severity,
+            "service": service,
+            "fingerprint": fingerprint,
+        }
+
+
+class LoadPublisher:
+    """
+    Publishes generated incidents with configurable pacing and batching.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        topic_id: str,
+        logger,
+        generator: IncidentGenerator,
+        batch_settings: BatchSettings,
+        ordering: str = "none",
+        envelope_size: int = 1,
+        compress: bool = False,
+        client: Optional[PublisherClient] = None,
+    ):
+        """
+        Initialize the load publisher.
+
+        Args:
+            project_id: Google Cloud project ID
+            topic_id: Pub/Sub topic ID
+            logger: Structured logger
+            generator: Source of incident commands
+            batch_settings: Client-side publish batching settings
+            ordering: Ordering key source: ``none``, ``service`` or ``fingerprint``
+            envelope_size: Commands per message; above 1 an NDJSON envelope is sent
+            compress: Gzip the message body
+            client: Publisher client, created from the settings when omitted
+        """
+        self.logger = logger
+        self.generator = generator
+        self.ordering = ordering
+        self.envelope_size = envelope_size
+        self.compress = compress
+        self.client = client or PublisherClient(
+            batch_settings=batch_settings,
+            publisher_options=PublisherOptions(
+                enable_message_ordering=ordering != "none"
+            ),
+        )
+        self.topic_path = self.client.topic_path(project_id, topic_id)
+        self.publish_latency = LatencyTracker()
+        self.sent = 0
+        self.failed = 0
+        self._outstanding = 0
+        self._cond = threading.Condition()
+
+    def create_topic(self) -> None:
+        """
+        Create the topic if it does not exist, for use with the emulator.
+        """
+        try:
+            self.client.create_topic(name=self.topic_path)
+            self.logger.info("Topic created", topic=self.topic_path)
+        except AlreadyExists:
+            pass
+
+    def build_message(self) -> tuple:
+        """
+        Build the next message body, attributes and ordering key.
+
+        Returns:
+            tuple: (data, attributes, ordering_key)
+        """
+        commands = [self.generator.next_command() for _ in range(self.envelope_size)]
+        attributes = {}
+        if self.envelope_size == 1:
+            command = commands[0]
+            attributes[COMMAND_TYPE_ATTRIBUTE] = command.pop("type")
+            data = json.dumps(command).encode("utf-8")
+        else:
+            attributes[CONTENT_TYPE_ATTRIBUTE] = NDJSON_CONTENT_TYPE
+            data = "\n".join(json.dumps(c) for c in commands).encode("utf-8")
+            command = min(commands, key=lambda c: SEVERITY_RANK[c["severity"]])
+        attributes[SEVERITY_ATTRIBUTE] = command["severity"]
+        if self.compress:
+            data = gzip.compress(data)
+            attributes[CONTENT_ENCODING_ATTRIBUTE] = "gzip"
+        ordering_key = "" if self.ordering == "none" else command[self.ordering]
+        return data, attributes, ordering_key
+
+    def publish_one(self) -> None:
+        """
+        Publish the next message without waiting for the server.
+        """
+        data, attributes, ordering_key = self.build_message()
+        attributes[PUBLISH_TIME_ATTRIBUTE] = str(time.time_ns())
+        started = time.monotonic()
+        with self._cond:
+            self._outstanding += 1
+        future = self.client.publish(
+            self.topic_path, data, ordering_key=ordering_key, **attributes
+        )
+        future.add_done_callback(
+            lambda f: self._on_published(f, started, ordering_key)
+        )
+        self.sent += 1
+
+    def run(
+        self,
+        rate: float = 100.0,
+        duration: Optional[float] = None,
+        count: Optional[int] = None,
+        burst_size: int = 0,
+        burst_interval: float = 1.0,
+    ) -> dict:
+        """
+        Publish until the duration or message count is reached.
+
+        Args:
+            rate: Target messages per second when not bursting
+            duration: Stop after this many seconds
+            count: Stop after this many messages
+            burst_size: Publish this many messages at once every burst_interval
+            burst_interval: Seconds between bursts
+
+        Returns:
+            dict: Run statistics
+        """
+        started = time.monotonic()
+
+        def finished():
+            if count is not None and self.sent >= count:
+                return True
+            return duration is not None and time.monotonic() - started >= duration
+
+        while not finished():
+            if burst_size:
+                for _ in range(burst_size):
+                    if finished():
+                        break
+                    self.publish_one()
+                if not finished():
+                    time.sleep(burst_interval)
+            else:
+                due = int((time.monotonic() - started) * rate)
+                while self.sent < due and not finished():
+                    self.publish_one()
+                time.sleep(0.001)
+
+        with self._cond:
+            self._cond.wait_for(lambda: self._outstanding == 0, timeout=60)
+        elapsed = time.monotonic() - started
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "elapsed_s": round(elapsed, 3),
+            "rate_per_s": round(self.sent / elapsed, 1) if elapsed else 0.0,
+            "publish_latency": self.publish_latency.summary(),
+        }
+
+    def _on_published(self, future, started: float, ordering_key: str) -> None:
+        """
+        Record the outcome of one publish.
+        """
+        try:
+            future.result()
+            self.publish_latency.record(time.monotonic() - started)
+        except Exception as e:
+            with self._cond:
+                self.failed += 1
+            self.logger.error(f"Publish failed: {e}")
+            if ordering_key:
+                # A failed ordered publish pauses its key until resumed
+                self.client.resume_publish(self.topic_path, ordering_key)
+        finally:
+            with self._cond:
+                self._outstanding -= 1
+                if not self._outstanding:
+                    self._cond.notify_all()
+
+
+def parse_arguments(argv=None):
+    """
+    Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed command line arguments
+    """
+    parse = argparse.ArgumentParser(description="Incident load generator")
+    parse.add_argument("--config")
+    parse.add_argument("--rate", type=float, default=100.0, help="messages per second")
+    parse.add_argument("--duration", type=float, help="seconds to run")
+    parse.add_argument("--count", type=int, help="messages to publish")
+    parse.add_argument("--burst-size", type=int, default=0)
+    parse.add_argument("--burst-interval", type=float, default=1.0)
+    parse.add_argument("--batch-max-messages", type=int, default=100)
+    parse.add_argument("--batch-max-bytes", type=int, default=1_000_000)
+    parse.add_argument("--batch-max-latency", type=float, default=0.01)
+    parse.add_argument(
+        "--ordering", choices=("none", "service", "fingerprint"), default="none"
+    )
+    parse.add_argument("--envelope-size", type=int, default=1)
+    parse.add_argument("--gzip", action="store_true")
+    parse.add_argument("--resolve-ratio", type=float, default=0.3)
+    parse.add_argument("--seed", type=int)
+    parse.add_argument("--create-topic", action="store_true")
+    args = parse.parse_args(argv)
+    if args.duration is None and args.count is None:
+        parse.error("one of --duration or --count is required")
+    return args
+
+
+def main(argv=None):
+    """
+    Load generator entry point.
+    """
+    args = parse_arguments(argv)
+    container = Container()
+    config = container.config_manager().load_config(args.config)
+    logger = container.logger_manager().get_logger(__name__)
+
+    publisher = LoadPublisher(
+        project_id=config.get("project_id"),
+        topic_id=config.get("topic_id"),
+        logger=logger,
+        generator=IncidentGenerator(args.resolve_ratio, args.seed),
+        batch_settings=BatchSettings(
+            max_bytes=args.batch_max_bytes,
+            max_latency=args.batch_max_latency,
+            max_messages=args.batch_max_messages,
+        ),
+        ordering=args.ordering,
+        envelope_size=args.envelope_size,
+        compress=args.gzip,
+    )
+    if args.create_topic:
+        publisher.create_topic()
+
+    logger.info("Starting load generator", topic=publisher.topic_path)
+    stats = publisher.run(
+        rate=args.rate,
+        duration=args.duration,
+        count=args.count,
+        burst_size=args.burst_size,
+        burst_interval=args.burst_interval,
+    )
+    logger.info("Load generator finished", **stats)
+
+
+if __name__ == "__main__":
+    main()